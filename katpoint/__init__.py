@@ -32,7 +32,7 @@ import warnings as _warnings
 
 import future.utils
 
-from .target import Target, construct_azel_target, construct_radec_target, NonAsciiError
+from .target import Target, construct_azel_target, construct_radec_target, radecs, NonAsciiError
 from .antenna import Antenna
 from .timestamp import Timestamp
 from .flux import FluxDensityModel, FluxError
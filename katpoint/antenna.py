@@ -27,7 +27,7 @@ from builtins import object
 import numpy as np
 import ephem
 
-from .timestamp import Timestamp
+from .timestamp import _ephem_date, _ephem_dates
 from .ephem_extra import is_iterable
 from .conversion import enu_to_ecef, ecef_to_lla, lla_to_ecef, ecef_to_enu
 from .pointing import PointingModel
@@ -312,14 +312,20 @@ class Antenna(object):
             Local sidereal time(s), in radians
 
         """
-        def _scalar_local_sidereal_time(t):
-            """Calculate local sidereal time at a single time instant."""
-            self.observer.date = Timestamp(t).to_ephem_date()
-            return self.observer.sidereal_time()
-        if is_iterable(timestamp):
-            return np.array([_scalar_local_sidereal_time(t) for t in timestamp])
-        else:
-            return _scalar_local_sidereal_time(timestamp)
+        observer = self.observer
+        if not is_iterable(timestamp):
+            observer.date = _ephem_date(timestamp)
+            return observer.sidereal_time()
+        # Convert all timestamps up front and fill preallocated output array (using a private observer)
+        observer = observer.copy()
+        dates = _ephem_dates(timestamp)
+        lst = np.empty(dates.shape)
+        lst_flat = lst.ravel()
+        sidereal_time = observer.sidereal_time
+        for n, date in enumerate(dates.ravel().tolist()):
+            observer.date = date
+            lst_flat[n] = sidereal_time()
+        return lst
 
     def array_reference_antenna(self, name='array'):
         """Synthetic antenna at the delay model reference position of this antenna.
@@ -17,7 +17,6 @@
 """Target catalogue."""
 from __future__ import print_function, division, absolute_import
 from builtins import object
-from past.builtins import basestring
 
 import logging
 from collections import defaultdict
@@ -27,7 +26,7 @@ import numpy as np
 
 from .target import Target
 from .timestamp import Timestamp
-from .ephem_extra import rad2deg
+from .ephem_extra import rad2deg, _STRING_TYPES
 
 logger = logging.getLogger(__name__)
 
@@ -434,10 +433,10 @@ class Catalogue(object):
         >>> cat2.add(cat.targets)
 
         """
-        if isinstance(targets, basestring) or isinstance(targets, Target):
+        if isinstance(targets, _STRING_TYPES) or isinstance(targets, Target):
             targets = [targets]
         for target in targets:
-            if isinstance(target, basestring):
+            if isinstance(target, _STRING_TYPES):
                 # Ignore strings starting with a hash (assumed to be comments)
                 # or only containing whitespace
                 if (len(target.strip()) == 0) or (target[0] == '#'):
@@ -628,7 +627,14 @@ class Catalogue(object):
         """
         if len(self.targets) == 0:
             return None, 180.0
-        dist = rad2deg(np.array([target.separation(tgt, timestamp, antenna) for tgt in self.targets]))
+        timestamp = Timestamp(timestamp)
+        if antenna is None:
+            antenna = target.antenna
+        if antenna is None:
+            raise ValueError('Antenna object needed to calculate target position')
+        # Compute position of given target once, instead of once per catalogue target
+        azel = target.azel(timestamp, antenna)
+        dist = rad2deg(np.array([ephem.separation(azel, tgt.azel(timestamp, antenna)) for tgt in self.targets]))
         closest = dist.argmin()
         return self.targets[closest], dist[closest]
 
@@ -711,7 +717,7 @@ class Catalogue(object):
 
         # First apply static criteria (tags, flux) which do not depend on timestamp
         if tag_filter:
-            if isinstance(tags, basestring):
+            if isinstance(tags, _STRING_TYPES):
                 tags = tags.split()
             desired_tags = set([tag for tag in tags if tag[0] != '~'])
             undesired_tags = set([tag[1:] for tag in tags if tag[0] == '~'])
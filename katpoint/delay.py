@@ -23,7 +23,6 @@ delay correction for a correlator.
 """
 from __future__ import print_function, division, absolute_import
 from builtins import object, zip
-from past.builtins import basestring
 
 import logging
 import json
@@ -32,7 +31,7 @@ import numpy as np
 
 from .model import Parameter, Model
 from .conversion import azel_to_enu
-from .ephem_extra import lightspeed, is_iterable, _just_gimme_an_ascii_string
+from .ephem_extra import lightspeed, is_iterable, _just_gimme_an_ascii_string, _STRING_TYPES
 from .target import construct_radec_target
 
 
@@ -140,7 +139,7 @@ class DelayCorrection(object):
 
     def __init__(self, ants, ref_ant=None, sky_centre_freq=0.0, extra_delay=None):
         # Unpack JSON-encoded description string
-        if isinstance(ants, basestring):
+        if isinstance(ants, _STRING_TYPES):
             try:
                 descr = json.loads(ants)
             except ValueError:
@@ -17,7 +17,7 @@
 """Enhancements to PyEphem."""
 from __future__ import print_function, division, absolute_import
 from builtins import object
-from past.builtins import basestring
+from future.utils import binary_type, text_type, integer_types
 
 import numpy as np
 import ephem
@@ -29,10 +29,15 @@ import ephem
 # The speed of light, in metres per second
 lightspeed = ephem.c
 
+# Byte and text string types, as a tuple for fast isinstance checks (equivalent to past.builtins.basestring)
+_STRING_TYPES = (binary_type, text_type)
+# Real number types (including ephem.Angle and NumPy scalars), which are interpreted as angles in radians
+_NUMBER_TYPES = (float, np.floating, np.integer) + integer_types
+
 
 def is_iterable(x):
     """Checks if object is iterable (but not a string or 0-dimensional array)."""
-    return hasattr(x, '__iter__') and not isinstance(x, basestring) and \
+    return hasattr(x, '__iter__') and not isinstance(x, _STRING_TYPES) and \
         not (getattr(x, 'shape', None) == ())
 
 
@@ -94,11 +99,16 @@ def _to_angle(s, unit='d'):
 
 def angle_from_degrees(s):
     """Creates angle object from sexagesimal string in degrees or number in radians."""
+    # Numbers are already in radians, so skip the string handling in the common case
+    if isinstance(s, _NUMBER_TYPES):
+        return ephem.degrees(s)
     return ephem.degrees(_to_angle(s, unit='d'))
 
 
 def angle_from_hours(s):
     """Creates angle object from sexagesimal string in hours or number in radians."""
+    if isinstance(s, _NUMBER_TYPES):
+        return ephem.hours(s)
     return ephem.hours(_to_angle(s, unit='h'))
 
 
@@ -163,13 +173,44 @@ class NullBody(object):
 
     This body has the expected methods of :class:`Body`, but always returns NaNs
     for all coordinates. It is intended for use as a placeholder when no proper
-    target object is available, i.e. as a dummy target.
+    target object is available, i.e. as a dummy target. The body is read-only,
+    as a single instance is shared among all dummy targets.
 
     """
+    # Keep object small by using __slots__ instead of __dict__
+    __slots__ = ('name', 'az', 'alt', 'el', 'ra', 'dec', 'a_ra', 'a_dec')
+
     def __init__(self):
-        self.name = 'Nothing'
-        self.az = self.alt = self.el = np.nan
-        self.ra = self.dec = self.a_ra = self.a_dec = np.nan
+        # Bypass the read-only attribute protection while setting up the body
+        set_attr = super(NullBody, self).__setattr__
+        set_attr('name', 'Nothing')
+        for coord in ('az', 'alt', 'el', 'ra', 'dec', 'a_ra', 'a_dec'):
+            set_attr(coord, float('nan'))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Null body is read-only, since it is shared among dummy targets")
+
+    def __delattr__(self, name):
+        raise AttributeError("Null body is read-only, since it is shared among dummy targets")
+
+    # Null bodies are interchangeable, so copies and unpickled objects are simply the shared instance
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (_null_body, ())
 
     def compute(self, observer):
         pass
+
+
+# All null bodies are equivalent, so share a single instance among dummy targets
+NULL_BODY = NullBody()
+
+
+def _null_body():
+    """Shared null body (used to unpickle :class:`NullBody` objects)."""
+    return NULL_BODY
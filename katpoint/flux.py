@@ -17,13 +17,13 @@
 """Flux density model."""
 from __future__ import print_function, division, absolute_import
 from builtins import object
-from past.builtins import basestring
 
+import math
 import warnings
 
 import numpy as np
 
-from .ephem_extra import is_iterable
+from .ephem_extra import is_iterable, _STRING_TYPES
 
 
 class FluxError(ValueError):
@@ -102,7 +102,7 @@ class FluxDensityModel(object):
 
     def __init__(self, min_freq_MHz, max_freq_MHz=None, coefs=None):
         # If the first parameter is a description string, extract the relevant flux parameters from it
-        if isinstance(min_freq_MHz, basestring):
+        if isinstance(min_freq_MHz, _STRING_TYPES):
             # Cannot have other parameters if description string is given - this is a safety check
             if not (max_freq_MHz is None and coefs is None):
                 raise ValueError("First parameter '%s' is description string - cannot have other parameters" %
@@ -128,7 +128,7 @@ class FluxDensityModel(object):
         last_nondefault_coef = nondefault_coefs[-1] if len(nondefault_coefs) > 0 else 0
         pruned_coefs = self.coefs[:last_nondefault_coef + 1]
         self.description = '(%s %s %s)' % (
-            min_freq_MHz, max_freq_MHz, ' '.join([repr(float(c)) for c in pruned_coefs])
+            min_freq_MHz, max_freq_MHz, ' '.join([repr(c) for c in pruned_coefs.tolist()])
         )
 
     def __str__(self):
@@ -136,7 +136,7 @@ class FluxDensityModel(object):
         return "Flux density defined for %d-%d MHz, coefs=(%s)" % (
             self.min_freq_MHz,
             self.max_freq_MHz,
-            ', '.join([repr(float(c)) for c in self.coefs]),
+            ', '.join([repr(c) for c in self.coefs.tolist()]),
         )
 
     def __repr__(self):
@@ -163,11 +163,39 @@ class FluxDensityModel(object):
         return self.coefs[6:10]
 
     def _flux_density_raw(self, freq_MHz):
-        a, b, c, d, e, f = self.coefs[:6]
+        e, f = self.coefs[4:6]
         log10_v = np.log10(freq_MHz)
-        log10_S = a + b * log10_v + c * log10_v ** 2 + d * log10_v ** 3 + e * np.exp(f * log10_v)
+        # Evaluate Baars polynomial via Horner's scheme, with coefficients (d, c, b, a)
+        log10_S = np.polyval(self.coefs[3::-1], log10_v)
+        # The exponential term is usually absent
+        if e != 0.0:
+            log10_S = log10_S + e * np.exp(f * log10_v)
         return 10 ** log10_S
 
+    def _flux_density_scalar(self, freq_MHz):
+        """Evaluate :meth:`_flux_density_raw` for a single frequency using Python floats."""
+        a, b, c, d, e, f = self.coefs[:6].tolist()
+        try:
+            log10_v = math.log10(freq_MHz)
+            log10_S = a + log10_v * (b + log10_v * (c + log10_v * d))
+            if e != 0.0:
+                log10_S += e * math.exp(f * log10_v)
+            return 10.0 ** log10_S
+        except (ValueError, OverflowError):
+            # Let NumPy produce the appropriate NaN / infinity instead
+            return self._flux_density_raw(freq_MHz)
+
+    def _flux_density_array(self, freq_MHz):
+        """Evaluate :meth:`_flux_density_raw` as an array, with NaN where frequency is out of range."""
+        freq_MHz = np.asarray(freq_MHz, dtype=np.float64)
+        in_range = (freq_MHz >= self.min_freq_MHz) & (freq_MHz <= self.max_freq_MHz)
+        if in_range.all():
+            return np.asarray(self._flux_density_raw(freq_MHz), dtype=np.float64)
+        # Only evaluate the model on valid frequencies
+        flux = np.full(freq_MHz.shape, np.nan)
+        flux[in_range] = self._flux_density_raw(freq_MHz[in_range])
+        return flux
+
     def flux_density(self, freq_MHz):
         """Calculate Stokes I flux density for given observation frequency.
 
@@ -182,14 +210,13 @@ class FluxDensityModel(object):
             Flux density in Jy, or np.nan if the frequency is out of range
 
         """
-        flux = self._flux_density_raw(freq_MHz) * self.iquv_scale[0]
-        if is_iterable(freq_MHz):
-            freq_MHz = np.asarray(freq_MHz)
-            flux[freq_MHz < self.min_freq_MHz] = np.nan
-            flux[freq_MHz > self.max_freq_MHz] = np.nan
-            return flux
-        else:
-            return flux if (freq_MHz >= self.min_freq_MHz) and (freq_MHz <= self.max_freq_MHz) else np.nan
+        if not is_iterable(freq_MHz):
+            if not (self.min_freq_MHz <= freq_MHz <= self.max_freq_MHz):
+                return np.nan
+            return self._flux_density_scalar(freq_MHz) * self.iquv_scale[0]
+        flux = self._flux_density_array(freq_MHz)
+        flux *= self.iquv_scale[0]
+        return flux
 
     def flux_density_stokes(self, freq_MHz):
         """Calculate full-Stokes flux density for given observation frequency.
@@ -206,8 +233,4 @@ class FluxDensityModel(object):
             array has an extra final axis of length 4, corresponding to the I, Q, U, V
             components.
         """
-        freq_MHz = np.asarray(freq_MHz)
-        flux = np.asarray(self._flux_density_raw(freq_MHz))
-        flux[freq_MHz < self.min_freq_MHz] = np.nan
-        flux[freq_MHz > self.max_freq_MHz] = np.nan
-        return np.multiply.outer(flux, self.iquv_scale)
+        return np.multiply.outer(self._flux_density_array(freq_MHz), self.iquv_scale)
@@ -23,16 +23,18 @@ saving and display of parameters.
 from __future__ import print_function, division, absolute_import
 import future.utils
 from builtins import object, zip
-from past.builtins import basestring
 
 try:
     import ConfigParser as configparser  # python2
 except ImportError:
     import configparser  # python3
 from collections import OrderedDict
+import copy
 
 import numpy as np
 
+from .ephem_extra import _STRING_TYPES
+
 
 class Parameter(object):
     """Generic model parameter.
@@ -41,6 +43,11 @@ class Parameter(object):
     and enabling it to be read from a string and output to a string by getting
     and setting the :attr:`value_str` property.
 
+    Parameter values have to be real numbers. Once the parameter is part of a
+    :class:`Model`, its value is stored as a float64 in the model's value array,
+    so *from_str* must produce something that converts to float (e.g. angles
+    come back as plain floats in radians instead of :class:`ephem.Angle`).
+
     Parameters
     ----------
     name : string
@@ -50,7 +57,8 @@ class Parameter(object):
     doc : string
         Documentation string describing parameter
     from_str : function, signature float = f(string), optional
-        Conversion function to extract parameter from string
+        Conversion function to extract parameter from string (must return
+        a real number)
     to_str : function, signature string = f(float), optional
         Conversion function to express parameter as string
     value : float, optional
@@ -60,6 +68,7 @@ class Parameter(object):
 
     Attributes
     ----------
+    value
     value_str
 
     """
@@ -71,9 +80,26 @@ class Parameter(object):
         # These functions are underscored to encourage use of value_str instead
         self._from_str = from_str
         self._to_str = to_str
+        # Once the parameter is registered with a model, its value is stored there
+        self._model = None
+        self._index = None
         self.value = value if value is not None else default_value
         self.default_value = default_value
 
+    @property
+    def value(self):
+        """Parameter value (stored in the parent model if there is one)."""
+        if self._model is None:
+            return self._value
+        return self._model._values[self._index]
+
+    @value.setter
+    def value(self, val):
+        if self._model is None:
+            self._value = val
+        else:
+            self._model._values[self._index] = val
+
     def __bool__(self):
         """True if parameter is active, i.e. its value differs from default."""
         # Do explicit cast to bool, as value can be a NumPy type, resulting in
@@ -114,7 +140,10 @@ class Model(object):
     automatically picks the correct constructor based on the input.
 
     Parameter names and values may be accessed and modified via a dict-like
-    interface mapping names to values.
+    interface mapping names to values. The parameter values are stored together
+    in a single float array in the model, which the parameters index into.
+    Parameters that already belong to another model are copied first, so that
+    models constructed from the same parameter objects stay independent.
 
     Parameters
     ----------
@@ -124,7 +153,14 @@ class Model(object):
     """
     def __init__(self, params):
         self.header = {}
+        # Don't steal parameters from another model - give this model its own copies
+        params = [copy.copy(p) if p._model is not None else p for p in params]
         self.params = OrderedDict((p.name, p) for p in params)
+        # Move parameter values into a contiguous array and point parameters to it
+        self._values = np.fromiter((p.value for p in self.params.values()),
+                                   dtype=np.float64, count=len(self.params))
+        for n, p in enumerate(self.params.values()):
+            p._model, p._index = self, n
 
     def __len__(self):
         """Number of parameters in full model."""
@@ -189,16 +225,15 @@ class Model(object):
         return self.params.keys()
 
     def values(self):
-        """List of parameter values in the expected order ('tolist')."""
-        return [p.value for p in self]
+        """Parameter values in the expected order, as a copy of the float64 array."""
+        return self._values.copy()
 
     def fromlist(self, floats):
         """Load model from sequence of floats."""
         self.header = {}
         params = [p for p in self]
         min_len = min(len(params), len(floats))
-        for param, value in zip(params[:min_len], floats[:min_len]):
-            param.value = value
+        self._values[:min_len] = floats[:min_len]
         for param in params[min_len:]:
             param.value = param.default_value
 
@@ -290,20 +325,23 @@ class Model(object):
             description string). The default is an empty model.
 
         """
-        if isinstance(model, Model):
+        # Handle the common non-numeric cases first to avoid a NumPy conversion
+        if model is None:
+            self.fromlist([])
+        elif isinstance(model, Model):
             if not isinstance(model, type(self)):
                 raise BadModelFile('Cannot construct a %r from a %r' %
                                    (self.__class__.__name__,
                                     model.__class__.__name__))
             self.fromlist(model.values())
             self.header = dict(model.header)
-        elif isinstance(model, basestring):
+        elif isinstance(model, _STRING_TYPES):
             self.fromstring(model)
+        elif hasattr(model, 'readline'):
+            self.fromfile(model)
         else:
-            array = np.atleast_1d(model)
+            array = np.asarray(model)
             if array.dtype.kind in 'iuf' and array.ndim == 1:
                 self.fromlist(model)
-            elif model is not None:
-                self.fromfile(model)
             else:
-                self.fromlist([])
+                self.fromfile(model)
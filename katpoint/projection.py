@@ -121,6 +121,16 @@ Alternatively they can be called directly::
   x, y = katpoint.sphere_to_plane['ARC'](az0, el0, az, el)
   az, el = katpoint.plane_to_sphere['ARC'](az0, el0, x, y)
 
+Points with a mix of projection types can be handled in a single call to
+:func:`sphere_to_plane_batch` or :func:`plane_to_sphere_batch`. Many points
+projected relative to the same reference point can use a :class:`ProjectionFrame`,
+while several zenithal projections of the same points can share one call to
+:func:`sphere_to_ortho` via the :data:`ortho_to_plane` functions::
+
+  ortho = sphere_to_ortho(az0, el0, az, el)
+  x_sin, y_sin = ortho_to_plane['SIN'](*ortho)
+  x_tan, y_tan = ortho_to_plane['TAN'](*ortho)
+
 .. [Gre1993a] Greisen, "Non-linear Coordinate Systems in AIPS," AIPS Memo 27,
    1993.
 .. [Gre1993b] Greisen, "Additional Non-linear Coordinates in AIPS," AIPS Memo 46,
@@ -131,11 +141,16 @@ Alternatively they can be called directly::
 """
 from __future__ import print_function, division, absolute_import
 
+import math
+import functools
 import threading
 import contextlib
 
 import numpy as np
 
+# Valid elevation angles lie within +- this limit
+_PI_2 = np.pi / 2.0
+
 # --------------------------------------------------------------------------------------------------
 # --- Handling out-of-range inputs
 # --------------------------------------------------------------------------------------------------
@@ -241,7 +256,8 @@ def treat_out_of_range_values(x, err_msg, lower=None, upper=None):
     Returns
     -------
     treated_x : float or array of float
-        Treated values (guaranteed to be in range or NaN)
+        Treated values (guaranteed to be in range or NaN), with the same
+        precision as a floating-point array `x` (and double precision otherwise)
 
     Raises
     ------
@@ -255,12 +271,30 @@ def treat_out_of_range_values(x, err_msg, lower=None, upper=None):
     as out-of-range to avoid false alarms, but instead silently clipped to
     ensure that all returned data is in the valid range.
     """
+    treated_x = _treat_out_of_range_values(x, err_msg, lower, upper)
+    # Don't hand back the input array itself, so that callers may modify the result
+    return treated_x.copy() if isinstance(treated_x, np.ndarray) and treated_x is x else treated_x
+
+
+def _treat_out_of_range_values(x, err_msg, lower=None, upper=None):
+    """Version of :func:`treat_out_of_range_values` that returns in-range array `x` as is."""
+    # Fast path: check bounds directly or via min / max reductions, avoiding
+    # any temporary arrays (NaNs fail these comparisons and get handled below)
+    if np.isscalar(x):
+        if (lower is None or x >= lower) and (upper is None or x <= upper):
+            return float(x)
+        dtype = float
+    else:
+        # Keep single-precision arrays in single precision, and turn the rest into doubles
+        dtype = np.result_type(np.asarray(x), 1.0)
+        if np.size(x) and (lower is None or np.min(x) >= lower) and (upper is None or np.max(x) <= upper):
+            return np.asarray(x, dtype=dtype)
     # Cast output array to float so that we may assign NaNs to it if needed
-    clipped_x = np.asarray(np.clip(x, lower, upper), dtype=float)
+    clipped_x = np.asarray(np.clip(x, lower, upper), dtype=dtype)
     treatment = get_out_of_range_treatment()
     if treatment != 'clip':
         # Suppress false alarms due to rounding errors -> only flag substantial outliers
-        out_of_range = ~np.isclose(x, clipped_x, rtol=0., atol=4. * np.finfo(float).eps)
+        out_of_range = ~np.isclose(x, clipped_x, rtol=0., atol=4. * np.finfo(dtype).eps)
         if treatment == 'raise' and np.any(out_of_range):
             raise OutOfRangeError(err_msg)
         elif treatment == 'nan':
@@ -272,7 +306,7 @@ def treat_out_of_range_values(x, err_msg, lower=None, upper=None):
 # --------------------------------------------------------------------------------------------------
 
 
-def safe_scale(x, y, new_radius):
+def safe_scale(x, y, new_radius, radius=None, out=None):
     """Scale the length of the 2D (x, y) vector to a new radius in a safe way.
 
     This handles both scalars and arrays, and maps the origin to (new_radius, 0).
@@ -283,29 +317,74 @@ def safe_scale(x, y, new_radius):
         Coordinates of 2D vector(s) (unchanged by this function)
     new_radius : float or array
         Desired length of output vector(s)
+    radius : float or array, optional
+        Length of input vector(s), if already known (computed otherwise)
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (out_x, out_y), with the broadcast input shape
+        (these may also be the `x` and `y` arrays themselves)
 
     Returns
     -------
     out_x, out_y : float or array
         Coordinates of 2D vector(s) guaranteed to have length `new_radius`
     """
-    radius = np.asarray(np.hypot(x, y))
-    new_radius = np.asarray(new_radius)
-    needs_scaling = new_radius != radius
-    scalable = needs_scaling & (radius != 0.0)
-    unscalable = needs_scaling & (radius == 0.0)
-    scale = new_radius[scalable] / radius[scalable]
-    out_x = np.array(x)
-    out_y = np.array(y)
-    out_x[scalable] *= scale
-    out_y[scalable] *= scale
-    out_x[unscalable] = new_radius[unscalable]
-    out_y[unscalable] = 0.0
+    radius = np.hypot(x, y) if radius is None else radius
+    scalable = radius != 0.0
+    # Masked division avoids building index arrays and gathering scalable elements
+    scale = np.ones(np.broadcast(radius, new_radius).shape, np.result_type(radius, new_radius))
+    np.divide(new_radius, radius, out=scale, where=scalable)
+    if out is not None:
+        # Scale straight into the output arrays and then map the origin to (new_radius, 0)
+        out_x, out_y = out
+        origin = ~scalable
+        np.copyto(np.multiply(x, scale, out=out_x), new_radius, where=origin)
+        np.copyto(np.multiply(y, scale, out=out_y), 0.0, where=origin)
+        return out_x, out_y
+    # Map the origin to (new_radius, 0)
+    out_x = np.where(scalable, x * scale, new_radius)
+    out_y = np.where(scalable, y * scale, 0.0)
     out_x = out_x.item() if np.isscalar(x) else out_x
     out_y = out_y.item() if np.isscalar(y) else out_y
     return out_x, out_y
 
 
+def _store_output(out, x, y):
+    """Store (x, y) in pair of output arrays `out` unless already there, or pass through if it is None."""
+    if out is None:
+        return x, y
+    x_out, y_out = out
+    if x is not x_out:
+        x_out[...] = x
+    if y is not y_out:
+        y_out[...] = y
+    return x_out, y_out
+
+
+def sincos(x):
+    """Sine and cosine of angle(s) `x`, in one call.
+
+    NumPy has no combined sincos ufunc, but for scalar angles the :mod:`math`
+    versions avoid the considerable ufunc overhead.
+
+    Parameters
+    ----------
+    x : float or array
+        Angle(s), in radians
+
+    Returns
+    -------
+    sin_x, cos_x : float or array
+        Sine and cosine of `x`, with the same shape as `x`
+    """
+    if isinstance(x, float):
+        try:
+            return math.sin(x), math.cos(x)
+        except ValueError:
+            # Infinite angles produce NaNs in the NumPy way (with a warning)
+            pass
+    return np.sin(x), np.cos(x)
+
+
 def sphere_to_ortho(az0, el0, az, el, min_cos_theta=None):
     """Do calculations common to all zenithal/azimuthal projections.
 
@@ -337,39 +416,80 @@ def sphere_to_ortho(az0, el0, az, el, min_cos_theta=None):
     cos_theta : float or array
         Angular separation of target and reference points, expressed as cosine
     """
+    sin_el0, cos_el0 = _reference_sincos(el0)
+    return _sphere_to_ortho(az0, sin_el0, cos_el0, az, el, min_cos_theta)
+
+
+def _wrap_angle(angle):
+    """Wrap angle(s) to the interval [-pi, pi), skipping the work if already there."""
+    # Two reductions are much cheaper than a remainder pass over the array
+    if np.isscalar(angle):
+        in_range = -np.pi <= angle < np.pi
+    else:
+        in_range = not np.size(angle) or (np.min(angle) >= -np.pi and np.max(angle) < np.pi)
+    return angle if in_range else (angle + np.pi) % (2.0 * np.pi) - np.pi
+
+
+def _reference_sincos(el0):
+    """Check elevation of reference point(s) and return its sine and cosine."""
     # Ensure that elevation angles are in valid range if they are finite numbers
     check = 'Elevation angle outside range of +- pi/2 radians'
-    el0 = treat_out_of_range_values(el0, check, lower=-np.pi / 2.0, upper=np.pi / 2.0)
-    el = treat_out_of_range_values(el, check, lower=-np.pi / 2.0, upper=np.pi / 2.0)
-    sin_el, cos_el, sin_el0, cos_el0 = np.sin(el), np.cos(el), np.sin(el0), np.cos(el0)
-    # Keep azimuth delta between -pi and pi - probably unnecessary,
-    # but the only normalisation of az inputs
-    delta_az = (az - az0 + np.pi) % (2.0 * np.pi) - np.pi
-    sin_daz, cos_daz = np.sin(delta_az), np.cos(delta_az)
+    el0 = _treat_out_of_range_values(el0, check, lower=-_PI_2, upper=_PI_2)
+    return sincos(el0)
+
+
+def _sphere_to_ortho(az0, sin_el0, cos_el0, az, el, min_cos_theta=None, out=None):
+    """Version of :func:`sphere_to_ortho` with precomputed sin / cos of `el0`.
+
+    If `out` is given, the orthographic (x, y) is stored in this pair of arrays.
+
+    """
+    check = 'Elevation angle outside range of +- pi/2 radians'
+    el = _treat_out_of_range_values(el, check, lower=-_PI_2, upper=_PI_2)
+    sin_el, cos_el = sincos(el)
+    # Keep azimuth delta between -pi and pi - mostly irrelevant inside sin / cos,
+    # but it settles the sign of x on the meridian opposite the reference point
+    sin_daz, cos_daz = sincos(_wrap_angle(az - az0))
+    # This term is shared by cos(theta) and the y coordinate
+    cos_el_cos_daz = cos_el * cos_daz
     # Theta is the native latitude (0 at reference point, increases radially outwards)
-    cos_theta = sin_el * sin_el0 + cos_el * cos_el0 * cos_daz
+    cos_theta = sin_el * sin_el0 + cos_el_cos_daz * cos_el0
     # Safeguard cos(theta), as over-ranging happens occasionally due to round-off error
-    cos_theta = np.clip(cos_theta, -1.0, 1.0)
+    # (clip arrays in place, as cos_theta is a fresh temporary)
+    cos_theta = np.clip(cos_theta, -1.0, 1.0, out=cos_theta if np.ndim(cos_theta) else None)
     # Do basic orthographic projection:
     # x = sin(theta) * sin(phi), y = sin(theta) * cos(phi)
-    ortho_x = cos_el * sin_daz
-    ortho_y = sin_el * cos_el0 - cos_el * sin_el0 * cos_daz
+    x_out, y_out = (None, None) if out is None else out
+    ortho_x = np.multiply(cos_el, sin_daz, out=x_out)
+    ortho_y = np.subtract(sin_el * cos_el0, cos_el_cos_daz * sin_el0, out=y_out)
     if min_cos_theta is not None:
-        check = ('Target point more than {} pi radians away from '
-                 'reference point'.format(np.arccos(min_cos_theta) / np.pi))
-        cos_theta = treat_out_of_range_values(cos_theta, check, lower=min_cos_theta)
-        # Adjust radius of (x, y) to be commensurate with potentially clipped cos(theta),
-        # and also propagate any NaNs in cos(theta) to (x, y) to complete out-of-range treatment
-        sin_theta = np.sqrt(1.0 - cos_theta * cos_theta)
-        ortho_x, ortho_y = safe_scale(ortho_x, ortho_y, new_radius=sin_theta)
+        return _limit_ortho(ortho_x, ortho_y, cos_theta, min_cos_theta, out)
     return ortho_x, ortho_y, cos_theta
 
+
+def _limit_ortho(ortho_x, ortho_y, cos_theta, min_cos_theta, out=None):
+    """Check angular separation against limit and treat (x, y) accordingly (storing it in `out`)."""
+    check = ('Target point more than {} pi radians away from '
+             'reference point'.format(np.arccos(min_cos_theta) / np.pi))
+    treated_cos_theta = _treat_out_of_range_values(cos_theta, check, lower=min_cos_theta)
+    # Adjust radius of (x, y) to be commensurate with potentially clipped cos(theta),
+    # and also propagate any NaNs in cos(theta) to (x, y) to complete out-of-range treatment
+    # (leave the rest alone, as sin(theta) derived from cos(theta) is inaccurate near 0)
+    adjusted = treated_cos_theta != cos_theta
+    if np.any(adjusted):
+        sin_theta = np.sqrt(1.0 - treated_cos_theta * treated_cos_theta)
+        sin_theta = np.where(adjusted, sin_theta, np.hypot(ortho_x, ortho_y))
+        ortho_x, ortho_y = safe_scale(ortho_x, ortho_y, new_radius=sin_theta, out=out)
+    else:
+        ortho_x, ortho_y = _store_output(out, ortho_x, ortho_y)
+    return ortho_x, ortho_y, treated_cos_theta
+
 # --------------------------------------------------------------------------------------------------
 # --- Orthographic projection (SIN)
 # --------------------------------------------------------------------------------------------------
 
 
-def sphere_to_plane_sin(az0, el0, az, el):
+def sphere_to_plane_sin(az0, el0, az, el, out=None):
     """Project sphere to plane using orthographic (SIN) projection.
 
     The orthographic projection requires the target point to be within the
@@ -397,6 +517,8 @@ def sphere_to_plane_sin(az0, el0, az, el):
         Azimuth / right ascension / longitude of target point(s), in radians
     el : float or array
         Elevation / declination / latitude of target point(s), in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (x, y) output, with the broadcast input shape
 
     Returns
     -------
@@ -416,14 +538,42 @@ def sphere_to_plane_sin(az0, el0, az, el):
     This implements the original SIN projection as in AIPS, not the generalised
     'slant orthographic' projection as in WCSLIB.
 
+    """
+    sin_el0, cos_el0 = _reference_sincos(el0)
+    return _sphere_to_plane_sin(az0, sin_el0, cos_el0, az, el, out)
+
+
+def _sphere_to_plane_sin(az0, sin_el0, cos_el0, az, el, out=None):
+    """Version of :func:`sphere_to_plane_sin` with precomputed sin / cos of `el0`."""
+    # Let the orthographic projection itself fill the output arrays
+    return ortho_to_plane_sin(*_sphere_to_ortho(az0, sin_el0, cos_el0, az, el, out=out), out=out)
+
+
+def ortho_to_plane_sin(ortho_x, ortho_y, cos_theta, out=None):
+    """Turn output of :func:`sphere_to_ortho` into orthographic (SIN) projection.
+
+    This allows several projections of the same points to share a single call
+    to :func:`sphere_to_ortho` (with no `min_cos_theta` limit).
+
+    Parameters
+    ----------
+    ortho_x, ortho_y, cos_theta : float or array
+        Orthographic (x, y) and cos(theta) as returned by :func:`sphere_to_ortho`
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (x, y) output, with the broadcast input shape
+
+    Returns
+    -------
+    x, y : float or array
+        Coordinate(s) on plane, as returned by :func:`sphere_to_plane_sin`
     """
     # Angular separation theta must be <= 90 degrees
-    ortho_x, ortho_y, _ = sphere_to_ortho(az0, el0, az, el, min_cos_theta=0.0)
     # x = sin(theta) * sin(phi), y = sin(theta) * cos(phi)
-    return ortho_x, ortho_y
+    x, y, _ = _limit_ortho(ortho_x, ortho_y, cos_theta, min_cos_theta=0.0, out=out)
+    return x, y
 
 
-def plane_to_sphere_sin(az0, el0, x, y):
+def plane_to_sphere_sin(az0, el0, x, y, out=None):
     """Deproject plane to sphere using orthographic (SIN) projection.
 
     The orthographic projection requires the (x, y) coordinates to lie within
@@ -449,6 +599,8 @@ def plane_to_sphere_sin(az0, el0, x, y):
         Azimuth-like coordinate(s) on plane (equivalent to l), in radians
     y : float or array
         Elevation-like coordinate(s) on plane (equivalent to m), in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (az, el) output, with the broadcast input shape
 
     Returns
     -------
@@ -469,18 +621,24 @@ def plane_to_sphere_sin(az0, el0, x, y):
     'slant orthographic' projection as in WCSLIB.
 
     """
-    check = 'Elevation angle outside range of +- pi/2 radians'
-    el0 = treat_out_of_range_values(el0, check, lower=-np.pi / 2.0, upper=np.pi / 2.0)
-    sin2_theta = x * x + y * y
+    sin_el0, cos_el0 = _reference_sincos(el0)
+    return _plane_to_sphere_sin(az0, sin_el0, cos_el0, x, y, out)
+
+
+def _plane_to_sphere_sin(az0, sin_el0, cos_el0, x, y, out=None):
+    """Version of :func:`plane_to_sphere_sin` with precomputed sin / cos of `el0`."""
+    # This is sin(theta)
+    r = np.hypot(x, y)
     check = 'Length of (x, y) vector bigger than 1.0'
-    sin2_theta = treat_out_of_range_values(sin2_theta, check, upper=1.0)
-    cos_theta = np.sqrt(1.0 - sin2_theta)
-    sin_el0, cos_el0 = np.sin(el0), np.cos(el0)
+    r = _treat_out_of_range_values(r, check, upper=1.0)
+    # Factorise 1 - r^2 to retain precision near the limb (r close to 1)
+    cos_theta = np.sqrt((1.0 - r) * (1.0 + r))
     sin_el = sin_el0 * cos_theta + cos_el0 * y
+    az_out, el_out = (None, None) if out is None else out
     # Safeguard the arcsin - in AIPS, clipping triggered "answer undefined", but that seems too harsh
-    el = np.arcsin(np.clip(sin_el, -1.0, 1.0))
+    el = np.arcsin(np.clip(sin_el, -1.0, 1.0), out=el_out)
     cos_el_cos_daz = cos_el0 * cos_theta - sin_el0 * y
-    az = az0 + np.arctan2(x, cos_el_cos_daz)
+    az = np.add(az0, np.arctan2(x, cos_el_cos_daz), out=az_out)
     return az, el
 
 # --------------------------------------------------------------------------------------------------
@@ -488,7 +646,7 @@ def plane_to_sphere_sin(az0, el0, x, y):
 # --------------------------------------------------------------------------------------------------
 
 
-def sphere_to_plane_tan(az0, el0, az, el):
+def sphere_to_plane_tan(az0, el0, az, el, out=None):
     """Project sphere to plane using gnomonic (TAN) projection.
 
     The gnomonic projection requires the target point to be within the
@@ -509,6 +667,8 @@ def sphere_to_plane_tan(az0, el0, az, el):
         Azimuth / right ascension / longitude of target point(s), in radians
     el : float or array
         Elevation / declination / latitude of target point(s), in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (x, y) output, with the broadcast input shape
 
     Returns
     -------
@@ -523,13 +683,41 @@ def sphere_to_plane_tan(az0, el0, az, el):
         If an elevation is out of range or target is too far from reference,
         and out-of-range treatment is 'raise'
     """
+    sin_el0, cos_el0 = _reference_sincos(el0)
+    return _sphere_to_plane_tan(az0, sin_el0, cos_el0, az, el, out)
+
+
+def _sphere_to_plane_tan(az0, sin_el0, cos_el0, az, el, out=None):
+    """Version of :func:`sphere_to_plane_tan` with precomputed sin / cos of `el0`."""
+    return ortho_to_plane_tan(*_sphere_to_ortho(az0, sin_el0, cos_el0, az, el), out=out)
+
+
+def ortho_to_plane_tan(ortho_x, ortho_y, cos_theta, out=None):
+    """Turn output of :func:`sphere_to_ortho` into gnomonic (TAN) projection.
+
+    This allows several projections of the same points to share a single call
+    to :func:`sphere_to_ortho` (with no `min_cos_theta` limit).
+
+    Parameters
+    ----------
+    ortho_x, ortho_y, cos_theta : float or array
+        Orthographic (x, y) and cos(theta) as returned by :func:`sphere_to_ortho`
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (x, y) output, with the broadcast input shape
+
+    Returns
+    -------
+    x, y : float or array
+        Coordinate(s) on plane, as returned by :func:`sphere_to_plane_tan`
+    """
     # Angular separation theta must be strictly < pi/2 radians - pick 1e-6 radians less
-    ortho_x, ortho_y, cos_theta = sphere_to_ortho(az0, el0, az, el, min_cos_theta=1e-6)
+    ortho_x, ortho_y, cos_theta = _limit_ortho(ortho_x, ortho_y, cos_theta, min_cos_theta=1e-6)
     # x = tan(theta) * sin(phi), y = tan(theta) * cos(phi)
-    return ortho_x / cos_theta, ortho_y / cos_theta
+    x_out, y_out = (None, None) if out is None else out
+    return np.divide(ortho_x, cos_theta, out=x_out), np.divide(ortho_y, cos_theta, out=y_out)
 
 
-def plane_to_sphere_tan(az0, el0, x, y):
+def plane_to_sphere_tan(az0, el0, x, y, out=None):
     """Deproject plane to sphere using gnomonic (TAN) projection.
 
     The input (x, y) coordinates are unrestricted. The returned target point is
@@ -548,6 +736,8 @@ def plane_to_sphere_tan(az0, el0, x, y):
         Azimuth-like coordinate(s) on plane, in radians
     y : float or array
         Elevation-like coordinate(s) on plane, in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (az, el) output, with the broadcast input shape
 
     Returns
     -------
@@ -561,13 +751,18 @@ def plane_to_sphere_tan(az0, el0, x, y):
     OutOfRangeError
         If elevation `el0` is out of range and out-of-range treatment is 'raise'
     """
-    check = 'Elevation angle outside range of +- pi/2 radians'
-    el0 = treat_out_of_range_values(el0, check, lower=-np.pi / 2.0, upper=np.pi / 2.0)
-    sin_el0, cos_el0 = np.sin(el0), np.cos(el0)
+    sin_el0, cos_el0 = _reference_sincos(el0)
+    return _plane_to_sphere_tan(az0, sin_el0, cos_el0, x, y, out)
+
+
+def _plane_to_sphere_tan(az0, sin_el0, cos_el0, x, y, out=None):
+    """Version of :func:`plane_to_sphere_tan` with precomputed sin / cos of `el0`."""
     # This term is cos(el) * cos(daz) / cos(theta)
     den = cos_el0 - y * sin_el0
-    az = az0 + np.arctan2(x, den)
-    el = np.arctan(np.cos(az - az0) * (sin_el0 + y * cos_el0) / den)
+    az_out, el_out = (None, None) if out is None else out
+    az = np.add(az0, np.arctan2(x, den), out=az_out)
+    # Since cos(daz) = den / hypot(x, den), tan(el) = (sin_el0 + y * cos_el0) / hypot(x, den)
+    el = np.arctan2(sin_el0 + y * cos_el0, np.hypot(x, den), out=el_out)
     return az, el
 
 # --------------------------------------------------------------------------------------------------
@@ -575,7 +770,7 @@ def plane_to_sphere_tan(az0, el0, x, y):
 # --------------------------------------------------------------------------------------------------
 
 
-def sphere_to_plane_arc(az0, el0, az, el):
+def sphere_to_plane_arc(az0, el0, az, el, out=None):
     """Project sphere to plane using zenithal equidistant (ARC) projection.
 
     The target point can be anywhere on the sphere. The output (x, y)
@@ -595,6 +790,8 @@ def sphere_to_plane_arc(az0, el0, az, el):
         Azimuth / right ascension / longitude of target point(s), in radians
     el : float or array
         Elevation / declination / latitude of target point(s), in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (x, y) output, with the broadcast input shape
 
     Returns
     -------
@@ -608,14 +805,43 @@ def sphere_to_plane_arc(az0, el0, az, el):
     OutOfRangeError
         If an elevation is out of range and out-of-range treatment is 'raise'
     """
-    ortho_x, ortho_y, cos_theta = sphere_to_ortho(az0, el0, az, el)
-    theta = np.arccos(cos_theta)
+    sin_el0, cos_el0 = _reference_sincos(el0)
+    return _sphere_to_plane_arc(az0, sin_el0, cos_el0, az, el, out)
+
+
+def _sphere_to_plane_arc(az0, sin_el0, cos_el0, az, el, out=None):
+    """Version of :func:`sphere_to_plane_arc` with precomputed sin / cos of `el0`."""
+    return ortho_to_plane_arc(*_sphere_to_ortho(az0, sin_el0, cos_el0, az, el), out=out)
+
+
+def ortho_to_plane_arc(ortho_x, ortho_y, cos_theta, out=None):
+    """Turn output of :func:`sphere_to_ortho` into zenithal equidistant (ARC) projection.
+
+    This allows several projections of the same points to share a single call
+    to :func:`sphere_to_ortho` (with no `min_cos_theta` limit).
+
+    Parameters
+    ----------
+    ortho_x, ortho_y, cos_theta : float or array
+        Orthographic (x, y) and cos(theta) as returned by :func:`sphere_to_ortho`
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (x, y) output, with the broadcast input shape
+
+    Returns
+    -------
+    x, y : float or array
+        Coordinate(s) on plane, as returned by :func:`sphere_to_plane_arc`
+    """
+    # Length of (x, y) vector is sin(theta) - use it to get an accurate theta everywhere
+    # (arccos(cos(theta)) loses precision near the reference point)
+    sin_theta = np.hypot(ortho_x, ortho_y)
+    theta = np.arctan2(sin_theta, cos_theta)
     # Scale length of (x, y) vector from sin(theta) to theta in a safe way
     # x = theta * sin(phi), y = theta * cos(phi)
-    return safe_scale(ortho_x, ortho_y, new_radius=theta)
+    return safe_scale(ortho_x, ortho_y, new_radius=theta, radius=sin_theta, out=out)
 
 
-def plane_to_sphere_arc(az0, el0, x, y):
+def plane_to_sphere_arc(az0, el0, x, y, out=None):
     """Deproject plane to sphere using zenithal equidistant (ARC) projection.
 
     The input (x, y) coordinates should lie within or on a circle of radius pi
@@ -635,6 +861,8 @@ def plane_to_sphere_arc(az0, el0, x, y):
         Azimuth-like coordinate(s) on plane, in radians
     y : float or array
         Elevation-like coordinate(s) on plane, in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (az, el) output, with the broadcast input shape
 
     Returns
     -------
@@ -649,23 +877,28 @@ def plane_to_sphere_arc(az0, el0, x, y):
         If elevation `el0` is out of range or the radius of (x, y) > pi,
         and out-of-range treatment is 'raise'
     """
-    check = 'Elevation angle outside range of +- pi/2 radians'
-    el0 = treat_out_of_range_values(el0, check, lower=-np.pi / 2.0, upper=np.pi / 2.0)
+    sin_el0, cos_el0 = _reference_sincos(el0)
+    return _plane_to_sphere_arc(az0, sin_el0, cos_el0, x, y, out)
+
+
+def _plane_to_sphere_arc(az0, sin_el0, cos_el0, x, y, out=None):
+    """Version of :func:`plane_to_sphere_arc` with precomputed sin / cos of `el0`."""
     theta = np.hypot(x, y)
     check = 'Length of (x, y) vector bigger than pi'
-    theta = treat_out_of_range_values(theta, check, upper=np.pi)
-    sin_theta, cos_theta = np.sin(theta), np.cos(theta)
-    # Scale length of (x, y) vector from theta to sin(theta) in a safe way
-    x, y = safe_scale(x, y, new_radius=sin_theta)
-    sin_el0, cos_el0 = np.sin(el0), np.cos(el0)
+    theta = _treat_out_of_range_values(theta, check, upper=np.pi)
+    cos_theta = np.cos(theta)
+    # Scale length of (x, y) vector from theta to sin(theta) via sinc, which handles the origin
+    scale = np.sinc(theta / np.pi)
+    x, y = x * scale, y * scale
     sin_el = cos_el0 * y + sin_el0 * cos_theta
+    az_out, el_out = (None, None) if out is None else out
     # Safeguard the arcsin - in AIPS, clipping triggered "answer undefined", but that seems too harsh
-    el = np.arcsin(np.clip(sin_el, -1.0, 1.0))
+    el = np.arcsin(np.clip(sin_el, -1.0, 1.0), out=el_out)
     # This term is cos(el) * cos(el0) * sin(delta_az)
     num = cos_el0 * x
     # This term is cos(el) * cos(el0) * cos(delta_az)
     den = cos_theta - sin_el * sin_el0
-    az = az0 + np.arctan2(num, den)
+    az = np.add(az0, np.arctan2(num, den), out=az_out)
     return az, el
 
 # --------------------------------------------------------------------------------------------------
@@ -673,7 +906,7 @@ def plane_to_sphere_arc(az0, el0, x, y):
 # --------------------------------------------------------------------------------------------------
 
 
-def sphere_to_plane_stg(az0, el0, az, el):
+def sphere_to_plane_stg(az0, el0, az, el, out=None):
     """Project sphere to plane using stereographic (STG) projection.
 
     The target point can be anywhere on the sphere except in a small region
@@ -693,6 +926,8 @@ def sphere_to_plane_stg(az0, el0, az, el):
         Azimuth / right ascension / longitude of target point(s), in radians
     el : float or array
         Elevation / declination / latitude of target point(s), in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (x, y) output, with the broadcast input shape
 
     Returns
     -------
@@ -707,15 +942,44 @@ def sphere_to_plane_stg(az0, el0, az, el):
         If an elevation is out of range or target point opposite to reference,
         and out-of-range treatment is 'raise'
     """
+    sin_el0, cos_el0 = _reference_sincos(el0)
+    return _sphere_to_plane_stg(az0, sin_el0, cos_el0, az, el, out)
+
+
+def _sphere_to_plane_stg(az0, sin_el0, cos_el0, az, el, out=None):
+    """Version of :func:`sphere_to_plane_stg` with precomputed sin / cos of `el0`."""
+    return ortho_to_plane_stg(*_sphere_to_ortho(az0, sin_el0, cos_el0, az, el), out=out)
+
+
+def ortho_to_plane_stg(ortho_x, ortho_y, cos_theta, out=None):
+    """Turn output of :func:`sphere_to_ortho` into stereographic (STG) projection.
+
+    This allows several projections of the same points to share a single call
+    to :func:`sphere_to_ortho` (with no `min_cos_theta` limit).
+
+    Parameters
+    ----------
+    ortho_x, ortho_y, cos_theta : float or array
+        Orthographic (x, y) and cos(theta) as returned by :func:`sphere_to_ortho`
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (x, y) output, with the broadcast input shape
+
+    Returns
+    -------
+    x, y : float or array
+        Coordinate(s) on plane, as returned by :func:`sphere_to_plane_stg`
+    """
     # Angular separation theta must be strictly < pi radians - pick 4.5e-3 radians less
-    ortho_x, ortho_y, cos_theta = sphere_to_ortho(az0, el0, az, el, min_cos_theta=1e-5 - 1)
-    den = 1.0 + cos_theta
+    ortho_x, ortho_y, cos_theta = _limit_ortho(ortho_x, ortho_y, cos_theta, min_cos_theta=1e-5 - 1)
+    # Do a single division and share the result between x and y
+    scale = 2.0 / (1.0 + cos_theta)
     # x = 2 sin(theta) sin(phi) / (1 + cos(theta))
     # y = 2 sin(theta) cos(phi) / (1 + cos(theta))
-    return 2.0 * ortho_x / den, 2.0 * ortho_y / den
+    x_out, y_out = (None, None) if out is None else out
+    return np.multiply(scale, ortho_x, out=x_out), np.multiply(scale, ortho_y, out=y_out)
 
 
-def plane_to_sphere_stg(az0, el0, x, y):
+def plane_to_sphere_stg(az0, el0, x, y, out=None):
     """Deproject plane to sphere using stereographic (STG) projection.
 
     The input (x, y) coordinates are unrestricted. The target point can be
@@ -734,6 +998,8 @@ def plane_to_sphere_stg(az0, el0, x, y):
         Azimuth-like coordinate(s) on plane, in radians
     y : float or array
         Elevation-like coordinate(s) on plane, in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (az, el) output, with the broadcast input shape
 
     Returns
     -------
@@ -747,24 +1013,32 @@ def plane_to_sphere_stg(az0, el0, x, y):
     OutOfRangeError
         If elevation `el0` is out of range and out-of-range treatment is 'raise'
     """
-    check = 'Elevation angle outside range of +- pi/2 radians'
-    el0 = treat_out_of_range_values(el0, check, lower=-np.pi / 2.0, upper=np.pi / 2.0)
-    sin_el0, cos_el0 = np.sin(el0), np.cos(el0)
+    sin_el0, cos_el0 = _reference_sincos(el0)
+    return _plane_to_sphere_stg(az0, sin_el0, cos_el0, x, y, out)
+
+
+def _plane_to_sphere_stg(az0, sin_el0, cos_el0, x, y, out=None):
+    """Version of :func:`plane_to_sphere_stg` with precomputed sin / cos of `el0`."""
     # This is the square of 2 sin(theta) / (1 + cos(theta))
     r2 = x * x + y * y
-    cos_theta = (4.0 - r2) / (4.0 + r2)
-    scale = (1.0 + cos_theta) / 2.0
-    sin_el = cos_el0 * scale * y + sin_el0 * cos_theta
+    # Share a single reciprocal between cos(theta) and scale = (1 + cos(theta)) / 2
+    inv = 1.0 / (4.0 + r2)
+    cos_theta = (4.0 - r2) * inv
+    scale = 4.0 * inv
+    # This factor is shared by the el and az calculations
+    scale_cos_el0 = scale * cos_el0
+    sin_el = scale_cos_el0 * y + sin_el0 * cos_theta
+    az_out, el_out = (None, None) if out is None else out
     # Safeguard the arcsin - in AIPS, clipping triggered "answer undefined", but that seems too harsh
-    el = np.arcsin(np.clip(sin_el, -1.0, 1.0))
+    el = np.arcsin(np.clip(sin_el, -1.0, 1.0), out=el_out)
     # The M-check in AIPS NEWPOS can be avoided by using arctan2 instead of arcsin.
     # This follows the same approach as in the AIPS code for ARC, and improves
     # azimuth accuracy substantially for large (x, y) values.
     # This term is cos(el) * cos(el0) * sin(delta_az)
-    num = x * scale * cos_el0
+    num = scale_cos_el0 * x
     # This term is cos(el) * cos(el0) * cos(delta_az)
     den = cos_theta - sin_el * sin_el0
-    az = az0 + np.arctan2(num, den)
+    az = np.add(az0, np.arctan2(num, den), out=az_out)
     return az, el
 
 # --------------------------------------------------------------------------------------------------
@@ -772,7 +1046,7 @@ def plane_to_sphere_stg(az0, el0, x, y):
 # --------------------------------------------------------------------------------------------------
 
 
-def sphere_to_plane_car(az0, el0, az, el):
+def sphere_to_plane_car(az0, el0, az, el, out=None):
     """Project sphere to plane using plate carree (CAR) projection.
 
     The target point can be anywhere on the sphere. The output (x, y)
@@ -791,6 +1065,8 @@ def sphere_to_plane_car(az0, el0, az, el):
         Azimuth / right ascension / longitude of target point(s), in radians
     el : float or array
         Elevation / declination / latitude of target point(s), in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (x, y) output, with the broadcast input shape
 
     Returns
     -------
@@ -800,10 +1076,11 @@ def sphere_to_plane_car(az0, el0, az, el):
         Elevation-like coordinate(s) on plane, in radians
 
     """
-    return az - az0, el - el0
+    x_out, y_out = (None, None) if out is None else out
+    return np.subtract(az, az0, out=x_out), np.subtract(el, el0, out=y_out)
 
 
-def plane_to_sphere_car(az0, el0, x, y):
+def plane_to_sphere_car(az0, el0, x, y, out=None):
     """Deproject plane to sphere using plate carree (CAR) projection.
 
     The input (x, y) coordinates are unrestricted. The target point can likewise
@@ -822,6 +1099,8 @@ def plane_to_sphere_car(az0, el0, x, y):
         Azimuth-like coordinate(s) on plane, in radians
     y : float or array
         Elevation-like coordinate(s) on plane, in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (az, el) output, with the broadcast input shape
 
     Returns
     -------
@@ -831,14 +1110,15 @@ def plane_to_sphere_car(az0, el0, x, y):
         Elevation / declination / latitude of target point(s), in radians
 
     """
-    return az0 + x, el0 + y
+    az_out, el_out = (None, None) if out is None else out
+    return np.add(az0, x, out=az_out), np.add(el0, y, out=el_out)
 
 # --------------------------------------------------------------------------------------------------
 # --- Swapped orthographic projection (SSN)
 # --------------------------------------------------------------------------------------------------
 
 
-def sphere_to_plane_ssn(az0, el0, az, el):
+def sphere_to_plane_ssn(az0, el0, az, el, out=None):
     """Project sphere to plane using swapped orthographic (SSN) projection.
 
     This is identical to the usual orthographic (SIN) projection, but with the
@@ -867,6 +1147,8 @@ def sphere_to_plane_ssn(az0, el0, az, el):
         Azimuth / right ascension / longitude of target point(s), in radians
     el : float or array
         Elevation / declination / latitude of target point(s), in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (x, y) output, with the broadcast input shape
 
     Returns
     -------
@@ -887,10 +1169,10 @@ def sphere_to_plane_ssn(az0, el0, az, el):
     in holography experiments.
 
     """
-    return sphere_to_plane_sin(az, el, az0, el0)
+    return sphere_to_plane_sin(az, el, az0, el0, out)
 
 
-def plane_to_sphere_ssn(az0, el0, x, y):
+def plane_to_sphere_ssn(az0, el0, x, y, out=None):
     r"""Deproject plane to sphere using swapped orthographic (SSN) projection.
 
     The swapped orthographic deprojection has more restrictions than the
@@ -927,6 +1209,8 @@ def plane_to_sphere_ssn(az0, el0, x, y):
         Azimuth-like coordinate(s) on plane (similar to l), in radians
     y : float or array
         Elevation-like coordinate(s) on plane (similar to m), in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (az, el) output, with the broadcast input shape
 
     Returns
     -------
@@ -947,30 +1231,46 @@ def plane_to_sphere_ssn(az0, el0, x, y):
     in holography experiments.
 
     """
-    check = 'Elevation angle outside range of +- pi/2 radians'
-    el0 = treat_out_of_range_values(el0, check, lower=-np.pi / 2.0, upper=np.pi / 2.0)
-    sin2_theta = x * x + y * y
+    sin_el0, cos_el0 = _reference_sincos(el0)
+    return _plane_to_sphere_ssn(az0, sin_el0, cos_el0, x, y, out)
+
+
+def _plane_to_sphere_ssn(az0, sin_el0, cos_el0, x, y, out=None):
+    """Version of :func:`plane_to_sphere_ssn` with precomputed sin / cos of `el0`."""
+    # This is sin(theta)
+    r = np.hypot(x, y)
     check = 'Length of (x, y) vector bigger than 1.0'
-    sin2_theta = treat_out_of_range_values(sin2_theta, check, upper=1.0)
-    cos_theta = np.sqrt(1.0 - sin2_theta)
-    sin_el0, cos_el0 = np.sin(el0), np.cos(el0)
+    r = _treat_out_of_range_values(r, check, upper=1.0)
+    # Factorise 1 - r^2 to retain precision near the limb (r close to 1)
+    cos_theta = np.sqrt((1.0 - r) * (1.0 + r))
     sin_daz = -x / cos_el0
     check = 'The x coordinate is outside range of +- cos(el0) radians'
-    sin_daz = treat_out_of_range_values(sin_daz, check, lower=-1.0, upper=1.0)
+    sin_daz = _treat_out_of_range_values(sin_daz, check, lower=-1.0, upper=1.0)
     # Since delta_az = az - az0 is the azimuth angle of final (x, cos(theta), y)
     # unit vector and cos(theta) >= 0, delta_az is restricted to +-90 degrees,
     # making the use of arcsin OK here
-    az = az0 + np.arcsin(sin_daz)
-    # Because of restrictions of el0 and delta_az, cos(el0) cos(delta_az) >= 0
-    cos_el0_cos_daz = cos_el0 * np.cos(az - az0)
+    az_out, el_out = (None, None) if out is None else out
+    az = np.add(az0, np.arcsin(sin_daz), out=az_out)
+    # Because of restrictions of el0 and delta_az, cos(el0) cos(delta_az) >= 0,
+    # which also allows cos(delta_az) to be obtained from sin(delta_az) without trig
+    cos_el0_cos_daz = cos_el0 * np.sqrt((1.0 - sin_daz) * (1.0 + sin_daz))
     num = sin_el0 * cos_theta - cos_el0_cos_daz * y
     den = sin_el0 * y + cos_theta * cos_el0_cos_daz
     # Ensure that cos(el) denominator term is positive to have abs(el) <= 90 degrees
     check = 'The y coordinate causes el to be outside range of +- pi/2 radians'
-    den = treat_out_of_range_values(den, check, lower=0.0)
-    el = np.arctan2(num, den)
+    den = _treat_out_of_range_values(den, check, lower=0.0)
+    # A clipped zero denominator means that cos(el) = 0, so el has to be +-90 degrees.
+    # If num is also exactly zero (x and r both clipped, so that cos(theta) = cos(delta_az) = 0),
+    # arctan2 would return 0 instead - redo num with cos(az - az0), which is tiny but nonzero
+    degenerate = (den == 0.0) & (num == 0.0)
+    if np.any(degenerate):
+        num = np.where(degenerate, sin_el0 * cos_theta - cos_el0 * np.cos(az - az0) * y, num)
+    el = np.arctan2(num, den, out=el_out)
     # Ensure that az is NaN when el is NaN
-    az = np.where(np.isnan(el), np.nan, az)
+    if out is None:
+        az = np.where(np.isnan(el), np.nan, az)
+    else:
+        np.copyto(az, np.nan, where=np.isnan(el))
     return az, el
 
 
@@ -992,3 +1292,206 @@ plane_to_sphere = {'SIN': plane_to_sphere_sin,
                    'STG': plane_to_sphere_stg,
                    'CAR': plane_to_sphere_car,
                    'SSN': plane_to_sphere_ssn}
+
+# Maps projection code to function that turns output of sphere_to_ortho into (x, y)
+ortho_to_plane = {'SIN': ortho_to_plane_sin,
+                  'TAN': ortho_to_plane_tan,
+                  'ARC': ortho_to_plane_arc,
+                  'STG': ortho_to_plane_stg}
+
+# Maps projection code to versions of functions with precomputed sin / cos of el0
+_sphere_to_plane_with_sincos = {'SIN': _sphere_to_plane_sin,
+                                'TAN': _sphere_to_plane_tan,
+                                'ARC': _sphere_to_plane_arc,
+                                'STG': _sphere_to_plane_stg}
+
+_plane_to_sphere_with_sincos = {'SIN': _plane_to_sphere_sin,
+                                'TAN': _plane_to_sphere_tan,
+                                'ARC': _plane_to_sphere_arc,
+                                'STG': _plane_to_sphere_stg,
+                                'SSN': _plane_to_sphere_ssn}
+
+
+class ProjectionFrame(object):
+    """Spherical projection with a fixed reference point.
+
+    This is useful when many target points are projected relative to the same
+    reference point in separate calls. The reference elevation is checked and
+    its sine and cosine are computed only once, when the frame is created
+    (except for the CAR projection, which needs neither).
+
+    Parameters
+    ----------
+    projection_type : {'SIN', 'TAN', 'ARC', 'STG', 'CAR', 'SSN'}
+        Type of spherical projection
+    az0 : float or array
+        Azimuth / right ascension / longitude of reference point(s), in radians
+    el0 : float or array
+        Elevation / declination / latitude of reference point(s), in radians
+    chunk_size : int or None, optional
+        If the reference point is scalar, process large inputs in chunks of
+        this many points so that all intermediate arrays stay in the CPU
+        cache (None disables chunking)
+
+    Raises
+    ------
+    ValueError
+        If the projection type is not supported
+    OutOfRangeError
+        If elevation `el0` is out of range and out-of-range treatment is 'raise'
+    """
+    def __init__(self, projection_type, az0, el0, chunk_size=131072):
+        if projection_type not in sphere_to_plane:
+            raise ValueError("Projection type '{}' not supported, must be one of {}"
+                             .format(projection_type, sorted(sphere_to_plane)))
+        self.projection_type = projection_type
+        self.az0 = az0
+        self.el0 = el0
+        self.chunk_size = chunk_size
+        # Bind reference point to projection functions, preferably with precomputed trig
+        if projection_type in _plane_to_sphere_with_sincos:
+            sin_el0, cos_el0 = _reference_sincos(el0)
+            self._inverse = functools.partial(_plane_to_sphere_with_sincos[projection_type],
+                                              az0, sin_el0, cos_el0)
+        else:
+            self._inverse = functools.partial(plane_to_sphere[projection_type], az0, el0)
+        if projection_type in _sphere_to_plane_with_sincos:
+            self._forward = functools.partial(_sphere_to_plane_with_sincos[projection_type],
+                                              az0, sin_el0, cos_el0)
+        else:
+            self._forward = functools.partial(sphere_to_plane[projection_type], az0, el0)
+
+    def __repr__(self):
+        """Short human-friendly string representation of projection frame object."""
+        return '<katpoint.ProjectionFrame %s at 0x%x>' % (self.projection_type, id(self))
+
+    def _apply(self, project, a, b, out=None):
+        """Apply bound projection function to coordinates (a, b), in chunks if needed."""
+        if self.chunk_size is None or np.ndim(self.az0) or np.ndim(self.el0):
+            return project(a, b, out)
+        a, b = np.broadcast_arrays(a, b)
+        if a.size <= self.chunk_size:
+            return project(a, b, out)
+        if out is None:
+            dtype = np.result_type(a, b, 1.0)
+            out = np.empty(a.shape, dtype), np.empty(a.shape, dtype)
+        out_a, out_b = out
+        # Chunks are written straight into flat views of the output arrays if possible
+        if not (out_a.flags.c_contiguous and out_b.flags.c_contiguous):
+            return _store_output(out, *self._apply(project, a, b))
+        a_flat, b_flat = a.ravel(), b.ravel()
+        out_a_flat, out_b_flat = out_a.reshape(-1), out_b.reshape(-1)
+        for start in range(0, a.size, self.chunk_size):
+            chunk = slice(start, start + self.chunk_size)
+            project(a_flat[chunk], b_flat[chunk], (out_a_flat[chunk], out_b_flat[chunk]))
+        return out_a, out_b
+
+    def sphere_to_plane(self, az, el, out=None):
+        """Project target point(s) (az, el) on sphere to (x, y) on plane."""
+        return self._apply(self._forward, az, el, out)
+
+    def plane_to_sphere(self, x, y, out=None):
+        """Deproject point(s) (x, y) on plane to target point(s) (az, el) on sphere."""
+        return self._apply(self._inverse, x, y, out)
+
+
+def _project_batch(projections, projection_types, ref_lon, ref_lat, lon, lat, out=None):
+    """Apply a mix of projections, grouping the inputs by projection type."""
+    # Broadcast all inputs to a common shape once (these are views, not copies)
+    projection_types, ref_lon, ref_lat, lon, lat = np.broadcast_arrays(
+        projection_types, ref_lon, ref_lat, lon, lat)
+    if out is None:
+        out_lon = np.empty(projection_types.shape)
+        out_lat = np.empty(projection_types.shape)
+    else:
+        out_lon, out_lat = out
+    # Call each projection function only once on all relevant inputs
+    for projection_type in np.unique(projection_types):
+        group = projection_types == projection_type
+        out_lon[group], out_lat[group] = projections[projection_type](
+            ref_lon[group], ref_lat[group], lon[group], lat[group])
+    return out_lon, out_lat
+
+
+def sphere_to_plane_batch(projection_types, az0, el0, az, el, out=None):
+    """Project sphere to plane using a different projection for each point.
+
+    This is useful when many points are projected with a mix of projection
+    types. The points are grouped by projection type, and each projection
+    function is then only called once on its group of points. All inputs
+    are broadcast against each other.
+
+    Parameters
+    ----------
+    projection_types : string or array of strings
+        Projection code ('SIN', 'TAN', 'ARC', 'STG', 'CAR', 'SSN') of each point
+    az0 : float or array
+        Azimuth / right ascension / longitude of reference point(s), in radians
+    el0 : float or array
+        Elevation / declination / latitude of reference point(s), in radians
+    az : float or array
+        Azimuth / right ascension / longitude of target point(s), in radians
+    el : float or array
+        Elevation / declination / latitude of target point(s), in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (x, y) output, with the broadcast input shape
+        (e.g. the two columns of an (N, 2) array)
+
+    Returns
+    -------
+    x : array
+        Azimuth-like coordinate(s) on plane, in radians
+    y : array
+        Elevation-like coordinate(s) on plane, in radians
+
+    Raises
+    ------
+    KeyError
+        If a projection type is unknown
+    OutOfRangeError
+        If any projection encounters out-of-range inputs and out-of-range
+        treatment is 'raise'
+    """
+    return _project_batch(sphere_to_plane, projection_types, az0, el0, az, el, out)
+
+
+def plane_to_sphere_batch(projection_types, az0, el0, x, y, out=None):
+    """Deproject plane to sphere using a different projection for each point.
+
+    This is useful when many points are deprojected with a mix of projection
+    types. The points are grouped by projection type, and each projection
+    function is then only called once on its group of points. All inputs
+    are broadcast against each other.
+
+    Parameters
+    ----------
+    projection_types : string or array of strings
+        Projection code ('SIN', 'TAN', 'ARC', 'STG', 'CAR', 'SSN') of each point
+    az0 : float or array
+        Azimuth / right ascension / longitude of reference point(s), in radians
+    el0 : float or array
+        Elevation / declination / latitude of reference point(s), in radians
+    x : float or array
+        Azimuth-like coordinate(s) on plane, in radians
+    y : float or array
+        Elevation-like coordinate(s) on plane, in radians
+    out : tuple of 2 arrays, optional
+        Arrays in which to store (az, el) output, with the broadcast input shape
+        (e.g. the two columns of an (N, 2) array)
+
+    Returns
+    -------
+    az : array
+        Azimuth / right ascension / longitude of target point(s), in radians
+    el : array
+        Elevation / declination / latitude of target point(s), in radians
+
+    Raises
+    ------
+    KeyError
+        If a projection type is unknown
+    OutOfRangeError
+        If any projection encounters out-of-range inputs and out-of-range
+        treatment is 'raise'
+    """
+    return _project_batch(plane_to_sphere, projection_types, az0, el0, x, y, out)
@@ -16,18 +16,29 @@
 
 """Target object used for pointing and flux density calculation."""
 from __future__ import print_function, division, absolute_import
-from builtins import object, range
-from past.builtins import basestring
+from builtins import object
+
+import copy
+import operator
 
 import numpy as np
 import ephem
 
-from .timestamp import Timestamp
+from .timestamp import Timestamp, _ephem_date, _ephem_dates
 from .flux import FluxDensityModel
-from .ephem_extra import (StationaryBody, NullBody, is_iterable, lightspeed,
-                          deg2rad, rad2deg, angle_from_degrees, angle_from_hours)
+from .ephem_extra import (StationaryBody, NullBody, NULL_BODY, is_iterable, lightspeed,
+                          deg2rad, rad2deg, angle_from_degrees, angle_from_hours, _STRING_TYPES)
 from .conversion import azel_to_enu
-from .projection import sphere_to_plane, sphere_to_ortho, plane_to_sphere
+from .projection import sphere_to_plane, sphere_to_ortho, plane_to_sphere, ProjectionFrame
+
+
+# Recognised body type tags (as a tuple of prefixes suitable for str.startswith)
+_BODY_TYPES = ('azel', 'radec', 'gal', 'tle', 'special', 'star', 'xephem')
+
+# Parsed target parameters, keyed by description string
+_PARAMS_CACHE = {}
+# Maximum size for parsed target parameter cache
+_PARAMS_CACHE_SIZE = 4096
 
 
 class NonAsciiError(ValueError):
@@ -35,6 +46,80 @@ class NonAsciiError(ValueError):
     pass
 
 
+def _copy_body(body):
+    """Copy of PyEphem body (or katpoint equivalent), which can be computed independently."""
+    if isinstance(body, NullBody):
+        return body
+    return body.copy() if isinstance(body, ephem.Body) else copy.copy(body)
+
+
+def _bodies_coordinates(bodies, observer, dates, lon_attr, lat_attr):
+    """Compute bodies as seen by observer at array of ephem dates and return a pair of coordinates.
+
+    All bodies are computed at each date in turn, as ephem reuses its
+    time-dependent calculations between them. The loop works on private copies
+    of observer and bodies, so that it does not interfere with (or suffer from)
+    other threads using the shared objects. The coordinate arrays have shape
+    ``(len(bodies),) + dates.shape``.
+
+    """
+    observer = observer.copy()
+    bodies = [_copy_body(body) for body in bodies]
+    # Fill preallocated output arrays, one row per body
+    lon, lat = np.empty((len(bodies), dates.size)), np.empty((len(bodies), dates.size))
+    rows = list(zip(bodies, lon, lat))
+    # Bind methods and attribute getters outside the loop
+    computes = [body.compute for body in bodies]
+    coordinates = operator.attrgetter(lon_attr, lat_attr)
+    if len(bodies) == 1:
+        # Tighter loop for the common case of a single body
+        (body, lon_row, lat_row), compute = rows[0], computes[0]
+        for n, date in enumerate(dates.ravel().tolist()):
+            observer.date = date
+            compute(observer)
+            lon_row[n], lat_row[n] = coordinates(body)
+    else:
+        for n, date in enumerate(dates.ravel().tolist()):
+            observer.date = date
+            for compute in computes:
+                compute(observer)
+            for body, lon_row, lat_row in rows:
+                lon_row[n], lat_row[n] = coordinates(body)
+    shape = (len(bodies),) + dates.shape
+    return lon.reshape(shape), lat.reshape(shape)
+
+
+def _equatorial_to_galactic_matrix():
+    """Rotation matrix that turns J2000 equatorial unit vectors into galactic ones, as defined by ephem."""
+    columns = []
+    for ra, dec in [(0.0, 0.0), (np.pi / 2.0, 0.0), (0.0, np.pi / 2.0)]:
+        l, b = ephem.Galactic(ephem.Equatorial(ra, dec, epoch=ephem.J2000)).get()
+        columns.append([np.cos(b) * np.cos(l), np.cos(b) * np.sin(l), np.sin(b)])
+    return np.array(columns).T
+
+
+_EQUATORIAL_TO_GALACTIC = _equatorial_to_galactic_matrix()
+
+
+def _equatorial_to_galactic(ra, dec):
+    """Convert arrays of J2000 (ra, dec) to galactic (l, b) with a single rotation, all in radians."""
+    cos_dec = np.cos(dec)
+    equatorial = np.array([cos_dec * np.cos(ra), cos_dec * np.sin(ra), np.sin(dec)])
+    x, y, z = np.tensordot(_EQUATORIAL_TO_GALACTIC, equatorial, axes=1)
+    return np.arctan2(y, x) % (2.0 * np.pi), np.arctan2(z, np.hypot(x, y))
+
+
+def _angular_separation(lon1, lat1, lon2, lat2):
+    """Angular separation between points on the sphere (Vincenty formula, accurate at all distances)."""
+    sin_lat1, cos_lat1 = np.sin(lat1), np.cos(lat1)
+    sin_lat2, cos_lat2 = np.sin(lat2), np.cos(lat2)
+    sin_dlon, cos_dlon = np.sin(lon2 - lon1), np.cos(lon2 - lon1)
+    num1 = cos_lat2 * sin_dlon
+    num2 = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_dlon
+    denom = sin_lat1 * sin_lat2 + cos_lat1 * cos_lat2 * cos_dlon
+    return np.arctan2(np.hypot(num1, num2), denom)
+
+
 class Target(object):
     """A target which can be pointed at by an antenna.
 
@@ -121,13 +206,19 @@ class Target(object):
         If description string has the wrong format
 
     """
+    # Keep object small by using __slots__ instead of __dict__ (catalogues can hold many targets),
+    # which means that targets no longer accept arbitrary new attributes (but still support weakrefs)
+    __slots__ = ('body', 'name', 'tags', 'aliases', 'flux_model', 'antenna', 'flux_freq_MHz',
+                 '_description_cache', '__weakref__')
+
     def __init__(self, body, tags=None, aliases=None, flux_model=None, antenna=None, flux_freq_MHz=None):
         if isinstance(body, Target):
             body = body.description
         # If the first parameter is a description string, extract the relevant target parameters from it
-        if isinstance(body, basestring):
+        if isinstance(body, _STRING_TYPES):
             body, tags, aliases, flux_model = construct_target_params(body)
         self.body = body
+        self._description_cache = None
         self.name = self.body.name
         self.tags = []
         self.add_tags(tags)
@@ -147,9 +238,10 @@ class Target(object):
         descr += ', tags=%s' % (' '.join(self.tags),)
         if 'radec' in self.tags:
             descr += ', %s %s' % (self.body._ra, self.body._dec)
-        if self.body_type == 'azel':
+        body_type = self.body_type
+        if body_type == 'azel':
             descr += ', %s %s' % (self.body.az, self.body.el)
-        if self.body_type == 'gal':
+        if body_type == 'gal':
             l, b = ephem.Galactic(ephem.Equatorial(self.body._ra, self.body._dec)).get()
             descr += ', %.4f %.4f' % (rad2deg(l), rad2deg(b))
         if self.flux_model is None:
@@ -233,11 +325,29 @@ class Target(object):
     @property
     def description(self):
         """Complete string representation of target object, sufficient to reconstruct it."""
+        # The string is cached, based on everything that goes into it (target attributes are public and mutable)
+        body, body_type = self.body, self.body_type
+        fluxinfo = self.flux_model.description if self.flux_model is not None else None
+        if body_type in ('tle', 'xephem'):
+            # The orbital elements of these bodies are too many to track, so always format them afresh
+            return self._format_description(body_type, fluxinfo)
+        if body_type == 'azel':
+            coords = (body.az, body.el)
+        elif body_type in ('radec', 'gal'):
+            coords = (body._ra, body._dec)
+        else:
+            coords = None
+        key = (self.name, tuple(self.aliases), tuple(self.tags), fluxinfo, body, coords)
+        if self._description_cache is None or self._description_cache[0] != key:
+            self._description_cache = (key, self._format_description(body_type, fluxinfo))
+        return self._description_cache[1]
+
+    def _format_description(self, body_type, fluxinfo):
+        """Assemble description string of target with given body type and flux info."""
         names = ' | '.join([self.name] + self.aliases)
         tags = ' '.join(self.tags)
-        fluxinfo = self.flux_model.description if self.flux_model is not None else None
         fields = [names, tags]
-        if self.body_type == 'azel':
+        if body_type == 'azel':
             # Check if it's an unnamed target with a default name
             if names.startswith('Az:'):
                 fields = [tags]
@@ -245,7 +355,7 @@ class Target(object):
             if fluxinfo:
                 fields += [fluxinfo]
 
-        elif self.body_type == 'radec':
+        elif body_type == 'radec':
             # Check if it's an unnamed target with a default name
             if names.startswith('Ra:'):
                 fields = [tags]
@@ -253,7 +363,7 @@ class Target(object):
             if fluxinfo:
                 fields += [fluxinfo]
 
-        elif self.body_type == 'gal':
+        elif body_type == 'gal':
             # Check if it's an unnamed target with a default name
             if names.startswith('Galactic l:'):
                 fields = [tags]
@@ -262,7 +372,7 @@ class Target(object):
             if fluxinfo:
                 fields += [fluxinfo]
 
-        elif self.body_type == 'tle':
+        elif body_type == 'tle':
             # Switch body type to xephem, as XEphem only saves bodies in xephem edb format (no TLE output)
             tags = tags.replace(tags.partition(' ')[0], 'xephem tle')
             edb_string = self.body.writedb().replace(',', '~')
@@ -273,7 +383,7 @@ class Target(object):
             else:
                 fields = [names, tags, edb_string]
 
-        elif self.body_type == 'xephem':
+        elif body_type == 'xephem':
             # Replace commas in xephem string with tildes, to avoid clashing with main string structure
             # Also remove extra spaces added into string by writedb
             edb_string = '~'.join([edb_field.strip() for edb_field in self.body.writedb().split(',')])
@@ -307,14 +417,26 @@ class Target(object):
         """
         if tags is None:
             tags = []
-        if isinstance(tags, basestring):
+        if isinstance(tags, _STRING_TYPES):
             tags = [tags]
+        existing_tags = set(self.tags)
         for tag_str in tags:
             for tag in tag_str.split():
-                if tag not in self.tags:
+                if tag not in existing_tags:
+                    existing_tags.add(tag)
                     self.tags.append(tag)
         return self
 
+    def _body_coordinates(self, timestamp, antenna, lon_attr, lat_attr):
+        """Compute body as seen from antenna at time(s) and return a pair of coordinates."""
+        observer, body = antenna.observer, self.body
+        if not is_iterable(timestamp):
+            observer.date = _ephem_date(timestamp)
+            body.compute(observer)
+            return getattr(body, lon_attr), getattr(body, lat_attr)
+        lon, lat = _bodies_coordinates([body], observer, _ephem_dates(timestamp), lon_attr, lat_attr)
+        return lon[0], lat[0]
+
     def azel(self, timestamp=None, antenna=None):
         """Calculate target (az, el) coordinates as seen from antenna at time(s).
 
@@ -339,22 +461,14 @@ class Target(object):
 
         """
         if self.body_type == 'azel':
+            # Stationary targets need neither antenna nor ephem calculations
             if is_iterable(timestamp):
-                return np.tile(self.body.az, len(timestamp)), np.tile(self.body.el, len(timestamp))
+                shape = np.shape(timestamp)
+                return np.full(shape, float(self.body.az)), np.full(shape, float(self.body.el))
             else:
                 return self.body.az, self.body.el
         timestamp, antenna = self._set_timestamp_antenna_defaults(timestamp, antenna)
-
-        def _scalar_azel(t):
-            """Calculate (az, el) coordinates for a single time instant."""
-            antenna.observer.date = Timestamp(t).to_ephem_date()
-            self.body.compute(antenna.observer)
-            return self.body.az, self.body.alt
-        if is_iterable(timestamp):
-            azel = np.array([_scalar_azel(t) for t in timestamp])
-            return azel[:, 0], azel[:, 1]
-        else:
-            return _scalar_azel(timestamp)
+        return self._body_coordinates(timestamp, antenna, 'az', 'alt')
 
     def apparent_radec(self, timestamp=None, antenna=None):
         """Calculate target's apparent (ra, dec) coordinates as seen from antenna at time(s).
@@ -390,17 +504,7 @@ class Target(object):
 
         """
         timestamp, antenna = self._set_timestamp_antenna_defaults(timestamp, antenna)
-
-        def _scalar_radec(t):
-            """Calculate (ra, dec) coordinates for a single time instant."""
-            antenna.observer.date = Timestamp(t).to_ephem_date()
-            self.body.compute(antenna.observer)
-            return self.body.ra, self.body.dec
-        if is_iterable(timestamp):
-            radec = np.array([_scalar_radec(t) for t in timestamp])
-            return radec[:, 0], radec[:, 1]
-        else:
-            return _scalar_radec(timestamp)
+        return self._body_coordinates(timestamp, antenna, 'ra', 'dec')
 
     def astrometric_radec(self, timestamp=None, antenna=None):
         """Calculate target's astrometric (ra, dec) coordinates as seen from antenna at time(s).
@@ -434,21 +538,12 @@ class Target(object):
             original_radec = ephem.Equatorial(self.body._ra, self.body._dec, epoch=self.body._epoch)
             ra, dec = ephem.Equatorial(original_radec, epoch=ephem.J2000).get()
             if is_iterable(timestamp):
-                return np.tile(ra, len(timestamp)), np.tile(dec, len(timestamp))
+                shape = np.shape(timestamp)
+                return np.full(shape, float(ra)), np.full(shape, float(dec))
             else:
                 return ra, dec
         timestamp, antenna = self._set_timestamp_antenna_defaults(timestamp, antenna)
-
-        def _scalar_radec(t):
-            """Calculate (ra, dec) coordinates for a single time instant."""
-            antenna.observer.date = Timestamp(t).to_ephem_date()
-            self.body.compute(antenna.observer)
-            return self.body.a_ra, self.body.a_dec
-        if is_iterable(timestamp):
-            radec = np.array([_scalar_radec(t) for t in timestamp])
-            return radec[:, 0], radec[:, 1]
-        else:
-            return _scalar_radec(timestamp)
+        return self._body_coordinates(timestamp, antenna, 'a_ra', 'a_dec')
 
     # The default (ra, dec) coordinates are the astrometric ones
     radec = astrometric_radec
@@ -483,14 +578,13 @@ class Target(object):
         if self.body_type == 'gal':
             l, b = ephem.Galactic(ephem.Equatorial(self.body._ra, self.body._dec)).get()
             if is_iterable(timestamp):
-                return np.tile(l, len(timestamp)), np.tile(b, len(timestamp))
+                shape = np.shape(timestamp)
+                return np.full(shape, float(l)), np.full(shape, float(b))
             else:
                 return l, b
         ra, dec = self.astrometric_radec(timestamp, antenna)
         if is_iterable(ra):
-            lb = np.array([ephem.Galactic(ephem.Equatorial(ra[n], dec[n])).get()
-                           for n in range(len(ra))])
-            return lb[:, 0], lb[:, 1]
+            return _equatorial_to_galactic(ra, dec)
         else:
             return ephem.Galactic(ephem.Equatorial(ra, dec)).get()
 
@@ -847,13 +941,18 @@ class Target(object):
         # Get a common timestamp and antenna for both targets
         timestamp, antenna = self._set_timestamp_antenna_defaults(timestamp, antenna)
 
-        def _scalar_separation(t):
-            """Calculate angular separation for a single time instant."""
-            return ephem.separation(self.azel(t, antenna), other_target.azel(t, antenna))
-        if is_iterable(timestamp):
-            return np.array([_scalar_separation(t) for t in timestamp])
+        if not is_iterable(timestamp):
+            return ephem.separation(self.azel(timestamp, antenna), other_target.azel(timestamp, antenna))
+        if 'azel' in (self.body_type, other_target.body_type):
+            # Stationary targets are cheap, so simply get coordinates of each target in turn
+            az1, el1 = self.azel(timestamp, antenna)
+            az2, el2 = other_target.azel(timestamp, antenna)
         else:
-            return _scalar_separation(timestamp)
+            # Compute both bodies at each time instant, as ephem reuses its time-dependent calculations
+            (az1, az2), (el1, el2) = _bodies_coordinates([self.body, other_target.body], antenna.observer,
+                                                         _ephem_dates(timestamp), 'az', 'alt')
+        # Vectorised separation over all timestamps
+        return _angular_separation(az1, el1, az2, el2)
 
     def sphere_to_plane(self, az, el, timestamp=None, antenna=None, projection_type='ARC', coord_system='azel'):
         """Project spherical coordinates to plane with target position as reference.
@@ -937,6 +1036,37 @@ class Target(object):
             ref_az, ref_el = self.azel(timestamp, antenna)
             return plane_to_sphere[projection_type](ref_az, ref_el, x, y)
 
+    def projection_frame(self, timestamp=None, antenna=None, projection_type='ARC', coord_system='azel'):
+        """Projection frame with target position at given time(s) as reference.
+
+        This calculates the target position once and returns a frame that can
+        repeatedly project coordinates to and from the plane around it, which
+        is cheaper than calling :meth:`sphere_to_plane` / :meth:`plane_to_sphere`
+        with the same timestamp and antenna each time.
+
+        Parameters
+        ----------
+        timestamp : :class:`Timestamp` object or equivalent, or sequence, optional
+            Timestamp(s) in UTC seconds since Unix epoch (defaults to now)
+        antenna : :class:`Antenna` object, optional
+            Antenna pointing at target (defaults to default antenna)
+        projection_type : {'ARC', 'SIN', 'TAN', 'STG', 'CAR', 'SSN'}, optional
+            Type of spherical projection
+        coord_system : {'azel', 'radec'}, optional
+            Spherical coordinate system
+
+        Returns
+        -------
+        frame : :class:`ProjectionFrame` object
+            Projection with target (az, el) or (ra, dec) as reference point
+
+        """
+        if coord_system == 'radec':
+            ref_lon, ref_lat = self.radec(timestamp, antenna)
+        else:
+            ref_lon, ref_lat = self.azel(timestamp, antenna)
+        return ProjectionFrame(projection_type, ref_lon, ref_lat)
+
 # --------------------------------------------------------------------------------------------------
 # --- FUNCTION :  construct_target_params
 # --------------------------------------------------------------------------------------------------
@@ -969,6 +1099,25 @@ def construct_target_params(description):
     ValueError
         If *description* has the wrong format
 
+    """
+    params = _PARAMS_CACHE.get(description)
+    if params is None:
+        params = _parse_target_description(description)
+        # Clean out the oldest description if cache is full
+        while len(_PARAMS_CACHE) >= _PARAMS_CACHE_SIZE:
+            _PARAMS_CACHE.pop(next(iter(_PARAMS_CACHE)), None)
+        _PARAMS_CACHE[description] = params
+    body, tags, aliases, flux_model = params
+    # Hand out copies of the mutable parameters so that the cached ones stay intact
+    flux_model = copy.deepcopy(flux_model) if flux_model is not None else None
+    return _copy_body(body), list(tags), list(aliases), flux_model
+
+
+def _parse_target_description(description):
+    """Parse description string into parameters of Target object (uncached).
+
+    See :func:`construct_target_params` for parameters and return values.
+
     """
     try:
         description.encode('ascii')
@@ -979,9 +1128,7 @@ def construct_target_params(description):
         raise ValueError("Target description '%s' must have at least two fields" % description)
     # Check if first name starts with body type tag, while the next field does not
     # This indicates a missing names field -> add an empty name list in front
-    body_types = ['azel', 'radec', 'gal', 'tle', 'special', 'star', 'xephem']
-    if np.any([fields[0].startswith(s) for s in body_types]) and \
-       not np.any([fields[1].startswith(s) for s in body_types]):
+    if fields[0].startswith(_BODY_TYPES) and not fields[1].startswith(_BODY_TYPES):
         fields = [''] + fields
     # Extract preferred name from name list (starred or first entry), and make the rest aliases
     names = [s.strip() for s in fields[0].split('|')]
@@ -993,7 +1140,7 @@ def construct_target_params(description):
             preferred_name, aliases = names[ind][1:], names[:ind] + names[ind + 1:]
         except ValueError:
             preferred_name, aliases = names[0], names[1:]
-    tags = [s.strip() for s in fields[1].split(' ')]
+    tags = fields[1].split()
     if len(tags) == 0:
         raise ValueError("Target description '%s' needs at least one tag (body type)" % description)
     body_type = tags[0].lower()
@@ -1065,7 +1212,7 @@ def construct_target_params(description):
     elif body_type == 'special':
         special_name = preferred_name.capitalize()
         try:
-            body = getattr(ephem, special_name)() if special_name != 'Nothing' else NullBody()
+            body = getattr(ephem, special_name)() if special_name != 'Nothing' else NULL_BODY
         except AttributeError:
             raise ValueError("Target description '%s' contains unknown *special* body '%s'"
                              % (description, special_name))
@@ -1170,7 +1317,7 @@ def construct_radec_target(ra, dec):
     """
     body = ephem.FixedBody()
     # First try to interpret the string as decimal degrees
-    if isinstance(ra, basestring):
+    if isinstance(ra, _STRING_TYPES):
         try:
             ra = deg2rad(float(ra))
         except ValueError:
@@ -1181,3 +1328,62 @@ def construct_radec_target(ra, dec):
     body._ra = ra
     body._dec = dec
     return Target(body, 'radec')
+
+# --------------------------------------------------------------------------------------------------
+# --- FUNCTION :  radecs
+# --------------------------------------------------------------------------------------------------
+
+
+def radecs(targets, timestamp=None, antenna=None):
+    """Calculate astrometric (ra, dec) coordinates of several targets at time(s).
+
+    This is equivalent to stacking the results of :meth:`Target.radec` for each
+    target, but it is faster for many targets and timestamps, as all targets
+    are computed at each timestamp in turn, which lets PyEphem reuse its
+    time-dependent calculations.
+
+    Parameters
+    ----------
+    targets : sequence of :class:`Target` objects, length *K*
+        Targets to calculate
+    timestamp : :class:`Timestamp` object or equivalent, or sequence, optional
+        Timestamp(s) in UTC seconds since Unix epoch (defaults to now)
+    antenna : :class:`Antenna` object, optional
+        Antenna which points at targets (defaults to default antenna of first
+        target)
+
+    Returns
+    -------
+    ra : array of float, shape (*K*,) + shape of *timestamp*
+        Right ascension of each target, in radians
+    dec : array of float, shape (*K*,) + shape of *timestamp*
+        Declination of each target, in radians
+
+    Raises
+    ------
+    ValueError
+        If no antenna is specified, and the first target has no default
+        antenna either, while there are targets that need one
+
+    """
+    targets = list(targets)
+    if timestamp is None:
+        timestamp = Timestamp()
+    if antenna is None and targets:
+        antenna = targets[0].antenna
+    shape = (len(targets),) + np.shape(timestamp) if is_iterable(timestamp) else (len(targets),)
+    ra, dec = np.empty(shape), np.empty(shape)
+    # Fixed targets have constant coordinates, while the rest are computed together
+    computed = []
+    for k, target in enumerate(targets):
+        if target.body_type == 'radec':
+            ra[k], dec[k] = target.astrometric_radec(timestamp, antenna)
+        else:
+            computed.append(k)
+    if computed:
+        if antenna is None:
+            raise ValueError('Antenna object needed to calculate target position')
+        bodies = [targets[k].body for k in computed]
+        ra[computed], dec[computed] = _bodies_coordinates(bodies, antenna.observer, _ephem_dates(timestamp),
+                                                          'a_ra', 'a_dec')
+    return ra, dec
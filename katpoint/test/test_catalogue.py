@@ -124,6 +124,10 @@ class TestCatalogueConstruction(unittest.TestCase):
         closest_target, dist = cat.closest_to(test_target)
         self.assertEqual(closest_target.description, test_target.description, 'Closest target incorrect')
         self.assertAlmostEqual(dist, 0.0, places=5, msg='Target should be on top of itself')
+        timestamp = katpoint.Timestamp()
+        closest_target, dist = cat.closest_to(cat.targets[0], timestamp, test_target.antenna)
+        seps = [cat.targets[0].separation(tgt, timestamp, test_target.antenna) for tgt in cat.targets]
+        self.assertAlmostEqual(dist, katpoint.rad2deg(min(seps)), places=10, msg='Closest distance incorrect')
 
     def test_that_equality_and_hash_ignore_order(self):
         a = katpoint.Catalogue()
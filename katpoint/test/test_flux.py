@@ -18,6 +18,7 @@
 from __future__ import print_function, division, absolute_import
 
 import sys
+import warnings
 
 if sys.version_info < (3,):
     import unittest2 as unittest
@@ -63,9 +64,17 @@ class TestFluxDensityModel(unittest.TestCase):
                                 np.array([200.0, 200.0]), 'Flux calculation for multiple frequencies wrong')
         np.testing.assert_equal(self.flux_model.flux_density([0.5, 2.5]),
                                 np.array([np.nan, np.nan]), 'Flux calculation for out-of-range frequencies wrong')
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            np.testing.assert_equal(self.flux_model.flux_density([-1.0, 0.0, 1.5]), np.array([np.nan, np.nan, 200.0]),
+                                    'Flux calculation for non-positive frequencies wrong')
         self.assertRaises(ValueError, self.no_flux_target.flux_density)
         np.testing.assert_equal(self.no_flux_target.flux_density([1.5, 1.5]),
                                 np.array([np.nan, np.nan]), 'Empty flux model leads to wrong empty flux shape')
+        baars = katpoint.FluxDensityModel('(200.0 12000.0 -30.7667 26.4908 -7.0977 0.605334 1.0 -0.2)')
+        freqs = [200.0, 1400.0, 12000.0]
+        np.testing.assert_allclose([baars.flux_density(f) for f in freqs], baars.flux_density(freqs),
+                                   rtol=1e-12, err_msg='Scalar and vector flux calculations differ')
         self.flux_target.flux_freq_MHz = 1.5
         self.assertEqual(self.flux_target.flux_density(), 200.0, 'Flux calculation for default freq wrong')
         print(self.flux_target)
@@ -104,3 +104,12 @@ class TestModel(unittest.TestCase):
         self.assertEqual(list(m.values()), values, 'Parameter values do not match')
         m['NIAO'] = 6789.0
         self.assertEqual(m['NIAO'], 6789.0, 'Parameter setting via dict interface failed')
+        self.assertEqual(params[3].value, 6789.0, 'Parameter object not backed by model')
+        vals = m.values()
+        vals[0] = -1.0
+        self.assertEqual(m['POS_E'], 10.0, 'Model values should be a copy')
+        # Models built from the same parameter objects should not affect each other
+        m2 = katpoint.Model(params)
+        m['NIAO'] = 1.0
+        self.assertEqual(m2['NIAO'], 6789.0, 'Models should not share parameter values')
+        self.assertEqual(list(m.values())[3], 1.0, 'Model values should follow dict interface')
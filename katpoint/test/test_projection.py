@@ -24,7 +24,9 @@ import numpy as np
 
 import katpoint
 from katpoint.projection import (OutOfRangeError, out_of_range_context, treat_out_of_range_values,
-                                 set_out_of_range_treatment, get_out_of_range_treatment)
+                                 set_out_of_range_treatment, get_out_of_range_treatment,
+                                 sphere_to_plane_batch, plane_to_sphere_batch, ProjectionFrame,
+                                 sphere_to_ortho, ortho_to_plane)
 
 try:
     from .aips_projection import newpos, dircos
@@ -75,6 +77,10 @@ class TestOutOfRangeTreatment(unittest.TestCase):
         x = [1, 2, 3, 4]
         y = treat_out_of_range_values(x, 'Should not happen', lower=0, upper=5)
         np.testing.assert_array_equal(y, x)
+        x_array = np.array(x, dtype=float)
+        y = treat_out_of_range_values(x_array, 'Should not happen', lower=0, upper=5)
+        self.assertIsNot(y, x_array, 'In-range input array should not be returned as is')
+        np.testing.assert_array_equal(y, x_array)
         with out_of_range_context('raise'):
             with self.assertRaises(OutOfRangeError):
                 y = treat_out_of_range_values(x, 'Out of range', lower=2.1)
@@ -89,6 +95,8 @@ class TestOutOfRangeTreatment(unittest.TestCase):
         x = 2
         y = treat_out_of_range_values(x, 'Should not happen', lower=0, upper=5)
         np.testing.assert_array_equal(y, x)
+        y = treat_out_of_range_values(0.5, 'Should not happen', lower=0, upper=1)
+        self.assertEqual(y, 0.5)
         with out_of_range_context('raise'):
             with self.assertRaises(OutOfRangeError):
                 y = treat_out_of_range_values(x, 'Out of range', lower=2.1)
@@ -904,3 +912,179 @@ class TestProjectionSSN(unittest.TestCase):
             assert_angles_almost_equal(ae, [-np.pi / 2.0, 0.0], decimal=12)
             ae = np.array(self.plane_to_sphere(0.0, 0.0, 0.0, 2.0))
             assert_angles_almost_equal(ae, [0.0, -np.pi / 2.0], decimal=12)
+            # Both x and (x, y) length clipped, with clipped den = 0 -> el has to be +-90 degrees
+            az, el = self.plane_to_sphere(0.0, 0.5, np.array([2.0, -2.0, 2.0]), np.array([-2.0, -2.0, -3.0]))
+            np.testing.assert_almost_equal(np.abs(el), np.pi / 2.0, decimal=12)
+            az, el = self.plane_to_sphere(0.0, 0.5, 2.0, -2.0)
+            self.assertAlmostEqual(abs(el), np.pi / 2.0, places=12)
+
+
+class TestProjectionBatch(unittest.TestCase):
+    """Test projections with a mix of projection types."""
+    def setUp(self):
+        rs = np.random.RandomState(42)
+        N = 100
+        self.projection_types = rs.choice(['SIN', 'TAN', 'ARC', 'STG', 'CAR'], N)
+        self.az0 = np.pi * (2.0 * rs.rand(N) - 1.0)
+        # Keep away from poles (leave them as corner cases)
+        self.el0 = 0.999 * np.pi * (rs.rand(N) - 0.5)
+        # (x, y) points within unit circle, which is valid for all projections
+        theta = 0.9 * rs.rand(N)
+        phi = 2 * np.pi * rs.rand(N)
+        self.x = np.sin(theta) * np.cos(phi)
+        self.y = np.sin(theta) * np.sin(phi)
+
+    def test_batch_vs_individual(self):
+        """Batch projection: compare with individual projections."""
+        az, el = plane_to_sphere_batch(self.projection_types, self.az0, self.el0, self.x, self.y)
+        xx, yy = sphere_to_plane_batch(self.projection_types, self.az0, self.el0, az, el)
+        for n, projection_type in enumerate(self.projection_types):
+            a, e = katpoint.plane_to_sphere[projection_type](self.az0[n], self.el0[n], self.x[n], self.y[n])
+            assert_angles_almost_equal(az[n], a, decimal=12)
+            assert_angles_almost_equal(el[n], e, decimal=12)
+        np.testing.assert_almost_equal(self.x, xx, decimal=10)
+        np.testing.assert_almost_equal(self.y, yy, decimal=10)
+
+    def test_batch_output_array(self):
+        """Batch projection: store results in columns of (N, 2) array."""
+        targets = np.empty((len(self.x), 2))
+        az, el = plane_to_sphere_batch(self.projection_types, self.az0, self.el0, self.x, self.y,
+                                       out=(targets[:, 0], targets[:, 1]))
+        np.testing.assert_array_equal(targets, np.c_[az, el])
+        x, y = sphere_to_plane_batch(self.projection_types, self.az0, self.el0, *targets.T)
+        np.testing.assert_almost_equal(self.x, x, decimal=10)
+        np.testing.assert_almost_equal(self.y, y, decimal=10)
+
+    def test_batch_broadcasting(self):
+        """Batch projection: broadcast scalar reference point against arrays."""
+        az, el = plane_to_sphere_batch(self.projection_types, 0.1, 0.2, self.x, self.y)
+        xx, yy = sphere_to_plane_batch(self.projection_types, 0.1, 0.2, az, el)
+        self.assertEqual(az.shape, self.x.shape)
+        np.testing.assert_almost_equal(self.x, xx, decimal=10)
+        np.testing.assert_almost_equal(self.y, yy, decimal=10)
+
+
+class TestProjectionFrame(unittest.TestCase):
+    """Test projections with fixed reference point."""
+    def setUp(self):
+        rs = np.random.RandomState(42)
+        N = 100
+        self.az0 = np.pi * (2.0 * rs.rand() - 1.0)
+        self.el0 = 0.999 * np.pi * (rs.rand() - 0.5)
+        theta = 0.9 * rs.rand(N)
+        phi = 2 * np.pi * rs.rand(N)
+        self.x = np.sin(theta) * np.cos(phi)
+        self.y = np.sin(theta) * np.sin(phi)
+
+    def valid_points(self, projection_type):
+        """Points on plane that are valid for given projection type."""
+        # SSN needs |x| <= cos(el0), and the reference elevation is high
+        scale = 0.05 if projection_type == 'SSN' else 1.0
+        return scale * self.x, scale * self.y
+
+    def test_frame_vs_functions(self):
+        """Projection frame: compare with projection functions."""
+        for projection_type in ['SIN', 'TAN', 'ARC', 'STG', 'CAR', 'SSN']:
+            frame = ProjectionFrame(projection_type, self.az0, self.el0)
+            x0, y0 = self.valid_points(projection_type)
+            az, el = frame.plane_to_sphere(x0, y0)
+            a, e = katpoint.plane_to_sphere[projection_type](self.az0, self.el0, x0, y0)
+            np.testing.assert_array_equal(az, a)
+            np.testing.assert_array_equal(el, e)
+            xx, yy = frame.sphere_to_plane(az, el)
+            x, y = katpoint.sphere_to_plane[projection_type](self.az0, self.el0, az, el)
+            np.testing.assert_array_equal(xx, x)
+            np.testing.assert_array_equal(yy, y)
+            np.testing.assert_almost_equal(xx, x0, decimal=10)
+            np.testing.assert_almost_equal(yy, y0, decimal=10)
+
+    def test_bad_frame(self):
+        """Projection frame: invalid projection type or reference elevation."""
+        self.assertRaises(ValueError, ProjectionFrame, 'XYZ', 0.0, 0.0)
+        with out_of_range_context('raise'):
+            self.assertRaises(OutOfRangeError, ProjectionFrame, 'SIN', 0.0, 2.0)
+
+    def test_shared_ortho(self):
+        """Projection: share orthographic projection between zenithal projections."""
+        az, el = katpoint.plane_to_sphere['SIN'](self.az0, self.el0, self.x, self.y)
+        ortho = sphere_to_ortho(self.az0, self.el0, az, el)
+        for projection_type in ['SIN', 'TAN', 'ARC', 'STG']:
+            x, y = katpoint.sphere_to_plane[projection_type](self.az0, self.el0, az, el)
+            xx, yy = ortho_to_plane[projection_type](*ortho)
+            np.testing.assert_array_equal(xx, x)
+            np.testing.assert_array_equal(yy, y)
+
+    def test_output_arrays(self):
+        """Projection: store results in provided output arrays."""
+        az, el = katpoint.plane_to_sphere['SIN'](self.az0, self.el0, self.x, self.y)
+        for projection_type in ['SIN', 'TAN', 'ARC', 'STG', 'CAR', 'SSN']:
+            x, y = katpoint.sphere_to_plane[projection_type](self.az0, self.el0, az, el)
+            out = (np.empty_like(x), np.empty_like(y))
+            xx, yy = katpoint.sphere_to_plane[projection_type](self.az0, self.el0, az, el, out=out)
+            self.assertTrue(xx is out[0] and yy is out[1])
+            np.testing.assert_array_equal(xx, x)
+            np.testing.assert_array_equal(yy, y)
+            # Include the reference point itself and points beyond the projection limits
+            az1, el1 = np.r_[self.az0, az[:3] + np.pi], np.r_[self.el0, -el[:3]]
+            with out_of_range_context('nan'):
+                x, y = katpoint.sphere_to_plane[projection_type](self.az0, self.el0, az1, el1)
+                out = (np.empty_like(x), np.empty_like(y))
+                xx, yy = katpoint.sphere_to_plane[projection_type](self.az0, self.el0, az1, el1, out=out)
+            np.testing.assert_array_equal(xx, x)
+            np.testing.assert_array_equal(yy, y)
+            x0, y0 = self.valid_points(projection_type)
+            a, e = katpoint.plane_to_sphere[projection_type](self.az0, self.el0, x0, y0)
+            out = (np.empty_like(a), np.empty_like(e))
+            aa, ee = katpoint.plane_to_sphere[projection_type](self.az0, self.el0, x0, y0, out=out)
+            self.assertTrue(aa is out[0] and ee is out[1])
+            np.testing.assert_array_equal(aa, a)
+            np.testing.assert_array_equal(ee, e)
+            # Include points outside the valid region of the plane
+            x1, y1 = np.r_[x0[:3], 10.0, 0.0], np.r_[y0[:3], 0.0, 10.0]
+            with out_of_range_context('nan'):
+                a, e = katpoint.plane_to_sphere[projection_type](self.az0, self.el0, x1, y1)
+                out = (np.empty_like(a), np.empty_like(e))
+                aa, ee = katpoint.plane_to_sphere[projection_type](self.az0, self.el0, x1, y1, out=out)
+            np.testing.assert_array_equal(aa, a)
+            np.testing.assert_array_equal(ee, e)
+
+    def test_chunked_frame(self):
+        """Projection frame: process large inputs in chunks."""
+        for projection_type in ['SIN', 'TAN', 'ARC', 'STG', 'CAR', 'SSN']:
+            x, y = self.valid_points(projection_type)
+            x, y = x.reshape(4, 25), y.reshape(4, 25)
+            frame = ProjectionFrame(projection_type, self.az0, self.el0, chunk_size=None)
+            chunked_frame = ProjectionFrame(projection_type, self.az0, self.el0, chunk_size=7)
+            az, el = frame.plane_to_sphere(x, y)
+            aa, ee = chunked_frame.plane_to_sphere(x, y)
+            np.testing.assert_array_equal(aa, az)
+            np.testing.assert_array_equal(ee, el)
+            xx, yy = chunked_frame.sphere_to_plane(az, el)
+            np.testing.assert_array_equal(xx, frame.sphere_to_plane(az, el)[0])
+            np.testing.assert_array_equal(yy, frame.sphere_to_plane(az, el)[1])
+            # Chunks go straight into contiguous output arrays, and via a copy into strided ones
+            for out in [(np.empty_like(x), np.empty_like(y)), tuple(np.empty(x.shape + (2,)).transpose(2, 0, 1))]:
+                aa, ee = chunked_frame.plane_to_sphere(x, y, out=out)
+                self.assertTrue(aa is out[0] and ee is out[1])
+                np.testing.assert_array_equal(aa, az)
+                np.testing.assert_array_equal(ee, el)
+                xx, yy = chunked_frame.sphere_to_plane(az, el, out=out)
+                self.assertTrue(xx is out[0] and yy is out[1])
+                np.testing.assert_array_equal(xx, frame.sphere_to_plane(az, el)[0])
+                np.testing.assert_array_equal(yy, frame.sphere_to_plane(az, el)[1])
+
+    def test_single_precision(self):
+        """Projection: single-precision inputs stay in single precision."""
+        # Keep away from the poles, where float32 azimuths are too coarse,
+        # and stay within the valid SSN region
+        az0, el0 = 0.3, 0.4
+        x, y = (0.3 * self.x).astype(np.float32), (0.3 * self.y).astype(np.float32)
+        for projection_type in ['SIN', 'TAN', 'ARC', 'STG', 'CAR', 'SSN']:
+            az, el = katpoint.plane_to_sphere[projection_type](az0, el0, x, y)
+            xx, yy = katpoint.sphere_to_plane[projection_type](az0, el0, az, el)
+            self.assertEqual(az.dtype, np.float32)
+            self.assertEqual(el.dtype, np.float32)
+            self.assertEqual(xx.dtype, np.float32)
+            self.assertEqual(yy.dtype, np.float32)
+            np.testing.assert_allclose(xx, x, atol=1e-5)
+            np.testing.assert_allclose(yy, y, atol=1e-5)
@@ -18,10 +18,13 @@
 from __future__ import print_function, division, absolute_import
 
 import unittest
+import copy
 import time
 import pickle
+import weakref
 
 import numpy as np
+import ephem
 
 import katpoint
 
@@ -122,10 +125,17 @@ class TestTargetConstruction(unittest.TestCase):
         self.assertEqual(t1, t2, 'Equality with target failed')
         self.assertEqual(t1, katpoint.Target(t2), 'Construction with target object failed')
         self.assertEqual(t1, pickle.loads(pickle.dumps(t1)), 'Pickling failed')
+        self.assertIs(weakref.ref(t1)(), t1, 'Weak reference to target failed')
         try:
             self.assertEqual(hash(t1), hash(t2), 'Target hashes not equal')
         except TypeError:
             self.fail('Target object not hashable')
+        t1.add_tags('pulsar')
+        self.assertEqual(t1.description, 'piet | bollie, azel pulsar, 20:00:00.0, 30:00:00.0',
+                         'Target description string not updated after adding tags')
+        t1.body.az = ephem.degrees('40:00:00.0')
+        self.assertEqual(t1.description, 'piet | bollie, azel pulsar, 40:00:00.0, 30:00:00.0',
+                         'Target description string not updated after moving body')
 
     def test_constructed_coords(self):
         """Test whether calculated coordinates match those with which it is constructed."""
@@ -134,6 +144,9 @@ class TestTargetConstruction(unittest.TestCase):
         calc_az, calc_el = katpoint.rad2deg(calc_azel[0]), katpoint.rad2deg(calc_azel[1])
         self.assertEqual(calc_az, 10.0, 'Calculated az does not match specified value in azel target')
         self.assertEqual(calc_el, -10.0, 'Calculated el does not match specified value in azel target')
+        calc_az, calc_el = azel.azel(np.zeros((2, 3)))
+        self.assertEqual(calc_az.shape, (2, 3), 'Stationary az does not have the shape of timestamps')
+        np.testing.assert_array_equal(katpoint.rad2deg(calc_el), -10.0)
         radec = katpoint.Target(self.radec_target)
         calc_radec = radec.radec()
         calc_ra, calc_dec = katpoint.rad2deg(calc_radec[0]), katpoint.rad2deg(calc_radec[1])
@@ -158,6 +171,22 @@ class TestTargetConstruction(unittest.TestCase):
         np.testing.assert_almost_equal(calc_l2, 60.0, decimal=4)
         np.testing.assert_almost_equal(calc_b2, -60.0, decimal=4)
 
+    def test_cached_construction(self):
+        """Test that targets constructed from the same description are independent."""
+        for descr in (self.radec_target, self.azel_target, self.valid_targets[-1]):
+            t1, t2 = katpoint.Target(descr), katpoint.Target(descr)
+            self.assertIsNot(t1.body, t2.body, 'Targets share the same body')
+            t1.add_tags('pulsar')
+            t1.aliases.append('bollie')
+            t1.body.name = 'piet'
+            self.assertEqual(t2, katpoint.Target(descr), 'Modifying one target changed another')
+            self.assertNotEqual(t1, t2, 'Target was not modified')
+        descr = 'J1819-1458 | J1819-1459, radec psr, 18:19:36, -14:58:00, (1000.0 2000.0 1.0)'
+        t1, t2 = katpoint.Target(descr), katpoint.Target(descr)
+        self.assertIsNot(t1.flux_model, t2.flux_model, 'Targets share the same flux model')
+        t1.flux_model.coefs[0] = 2.0
+        np.testing.assert_array_equal(t2.flux_model.coefs, katpoint.Target(descr).flux_model.coefs)
+
     def test_add_tags(self):
         """Test adding tags."""
         tag_target = katpoint.Target(self.tag_target)
@@ -166,6 +195,32 @@ class TestTargetConstruction(unittest.TestCase):
         tag_target.add_tags(['SNR', 'GPS'])
         self.assertEqual(tag_target.tags, ['azel', 'J2000', 'GPS', 'pulsar', 'SNR'], 'Added tags not correct')
 
+    def test_description_follows_body(self):
+        """Test that description tracks in-place changes to xephem bodies."""
+        for descr in (self.valid_targets[-1], self.valid_targets[-3]):
+            t = katpoint.Target(descr)
+            old_description = t.description
+            t.body._ra = ephem.hours('1:00:00')
+            self.assertNotEqual(t.description, old_description, 'Description ignored change to body')
+            self.assertEqual(t, katpoint.Target(t.description), 'Target differs from its own description')
+
+    def test_shared_null_body(self):
+        """Test that the null body shared by dummy targets cannot be modified."""
+        t1, t2 = katpoint.Target('Nothing, special'), katpoint.Target('Nothing, special')
+        with self.assertRaises(AttributeError):
+            t1.body.name = 'piet'
+        with self.assertRaises(AttributeError):
+            t1.body.az = 0.0
+        self.assertEqual(t2.body.name, 'Nothing', 'Null body was modified')
+        self.assertTrue(np.isnan(t2.azel(0.0, katpoint.Antenna('A1, -31.0, 18.0, 0.0'))[0]))
+        # Fresh null bodies can be copied, pickled and computed at many times too
+        null_body = type(t1.body)()
+        self.assertIs(copy.copy(null_body), null_body, 'Null body copy should be itself')
+        self.assertIs(copy.deepcopy(null_body), null_body, 'Null body deep copy should be itself')
+        self.assertIs(pickle.loads(pickle.dumps(null_body)), t1.body, 'Unpickled null body should be shared')
+        az, el = katpoint.Target(null_body, 'special').azel([0.0, 1.0], katpoint.Antenna('A1, -31.0, 18.0, 0.0'))
+        self.assertTrue(np.all(np.isnan(az)) and np.all(np.isnan(el)), 'Null body has a position')
+
 
 class TestTargetCalculations(unittest.TestCase):
     """Test various calculations involving antennas and timestamps."""
@@ -184,6 +239,67 @@ class TestTargetCalculations(unittest.TestCase):
         self.target.galactic(self.ts, self.ant1)
         self.target.parallactic_angle(self.ts, self.ant1)
 
+    def test_coordinates_follow_state(self):
+        """Test that coordinates follow changes to the antenna and body objects."""
+        sun = katpoint.Target('Sun, special')
+        ts = [self.ts, self.ts + 10.0]
+        ant = katpoint.Antenna('A3, -30.0, 18.0, 0.0, 12.0, 0.0 0.0 0.0')
+        az, el = sun.azel(ts, ant)
+        ant.observer.lat = ephem.degrees('-20.0')
+        az2, el2 = sun.azel(ts, ant)
+        self.assertTrue(np.all(el2 != el), 'Coordinates did not follow change in observer')
+        target = katpoint.Target('radec, 20, -20')
+        az, el = target.azel(ts[0], ant)
+        target.body._dec = ephem.degrees('-10.0')
+        self.assertNotEqual(target.azel(ts[0], ant)[1], el, 'Coordinates did not follow change in body')
+
+    def test_timestamp_formats(self):
+        """Test that sequences of mixed timestamp formats match scalar calculations."""
+        sun = katpoint.Target('Sun, special')
+        ts = [self.ts.secs, self.ts + 10.0, self.ts.to_ephem_date(), '2013-08-14 08:25:30']
+        az, el = sun.azel(ts, self.ant1)
+        for n, t in enumerate(ts):
+            np.testing.assert_almost_equal(az[n], sun.azel(t, self.ant1)[0], decimal=9)
+            np.testing.assert_almost_equal(el[n], sun.azel(t, self.ant1)[1], decimal=9)
+        np.testing.assert_array_equal(sun.azel([ts[2], ts[2]], self.ant1)[0], az[[2, 2]])
+
+    def test_radecs(self):
+        """Test (ra, dec) calculation for multiple targets at once."""
+        targets = [katpoint.Target('Sun, special'), katpoint.Target('Moon, special'),
+                   katpoint.Target('radec, 20, -20'), self.target]
+        ts = [self.ts, self.ts + 3600.0, self.ts + 7200.0]
+        ra, dec = katpoint.radecs(targets, ts, self.ant1)
+        self.assertEqual(ra.shape, (4, 3), 'Multi-target (ra, dec) has wrong shape')
+        for k, target in enumerate(targets):
+            expected_ra, expected_dec = target.radec(ts, self.ant1)
+            np.testing.assert_almost_equal(ra[k], expected_ra, decimal=12)
+            np.testing.assert_almost_equal(dec[k], expected_dec, decimal=12)
+        ra, dec = katpoint.radecs(targets, self.ts, self.ant1)
+        np.testing.assert_almost_equal(ra, [target.radec(self.ts, self.ant1)[0] for target in targets], decimal=12)
+        self.assertRaises(ValueError, katpoint.radecs, targets, ts)
+
+    def test_shared_state_untouched(self):
+        """Test that array calculations leave the shared observer and body alone."""
+        sun = katpoint.Target('Sun, special')
+        sun.azel(self.ts, self.ant1)
+        date, az = self.ant1.observer.date, sun.body.az
+        sun.azel([self.ts + 3600.0, self.ts + 7200.0], self.ant1)
+        sun.separation(katpoint.Target('Moon, special'), [self.ts + 3600.0], self.ant1)
+        self.ant1.local_sidereal_time([self.ts + 3600.0])
+        self.assertEqual(self.ant1.observer.date, date, 'Array calculation changed date of antenna observer')
+        self.assertEqual(sun.body.az, az, 'Array calculation changed target body')
+
+    def test_galactic_array(self):
+        """Test that vectorised galactic coordinates match scalar ones."""
+        sun = katpoint.Target('Sun, special')
+        ts = [self.ts, self.ts + 86400.0 * 100, self.ts + 86400.0 * 200]
+        l, b = sun.galactic(ts, self.ant1)
+        for n, t in enumerate(ts):
+            np.testing.assert_almost_equal((l[n], b[n]), sun.galactic(t, self.ant1), decimal=12)
+        radec = katpoint.Target('radec, 20, -20')
+        ra, dec = radec.radec(np.zeros((2, 2)), self.ant1)
+        self.assertEqual(ra.shape, (2, 2), 'Constant (ra, dec) does not have the shape of timestamps')
+
     def test_delay(self):
         """Test geometric delay."""
         delay, delay_rate = self.target.geometric_delay(self.ant2, self.ts, self.ant1)
@@ -273,6 +389,12 @@ class TestTargetCalculations(unittest.TestCase):
         azel2 = katpoint.construct_azel_target(az, el + 0.01)
         sep = azel.separation(azel2, self.ts, self.ant1)
         np.testing.assert_almost_equal(sep, 0.01, decimal=12)
+        sep = azel.separation(azel2, [self.ts, self.ts + 3600.0], self.ant1)
+        np.testing.assert_almost_equal(sep, [0.01, 0.01], decimal=12)
+        ts = [self.ts, self.ts + 3600.0]
+        for other in (azel2, katpoint.Target('Moon, special')):
+            np.testing.assert_almost_equal(sun.separation(other, ts, self.ant1),
+                                           [other.separation(sun, t, self.ant1) for t in ts], decimal=12)
 
     def test_projection(self):
         """Test projection."""
@@ -281,3 +403,6 @@ class TestTargetCalculations(unittest.TestCase):
         re_az, re_el = self.target.plane_to_sphere(x, y, self.ts, self.ant1)
         np.testing.assert_almost_equal(re_az, az, decimal=12)
         np.testing.assert_almost_equal(re_el, el, decimal=12)
+        frame = self.target.projection_frame(self.ts, self.ant1)
+        np.testing.assert_array_equal(frame.sphere_to_plane(az, el), (x, y))
+        np.testing.assert_array_equal(frame.plane_to_sphere(x, y), (re_az, re_el))
@@ -17,7 +17,6 @@
 """A Timestamp object."""
 from __future__ import print_function, division, absolute_import
 from builtins import object
-from past.builtins import basestring
 
 import time
 import math
@@ -27,6 +26,11 @@ from functools import total_ordering
 import numpy as np
 import ephem
 
+from .ephem_extra import _STRING_TYPES
+
+# The Unix epoch (1970-01-01 00:00:00 UTC) as an ephem date, in Dublin Julian Days
+_UNIX_EPOCH_DJD = 25567.5
+
 
 @total_ordering
 class Timestamp(object):
@@ -64,7 +68,7 @@ class Timestamp(object):
 
     """
     def __init__(self, timestamp=None):
-        if isinstance(timestamp, basestring):
+        if isinstance(timestamp, _STRING_TYPES):
             try:
                 timestamp = ephem.Date(timestamp.strip().replace('-', '/'))
             except ValueError:
@@ -187,13 +191,30 @@ class Timestamp(object):
 
     def to_ephem_date(self):
         """Convert timestamp to :class:`ephem.Date` object."""
-        int_secs = math.floor(self.secs)
-        timetuple = list(time.gmtime(int_secs)[:6])
-        timetuple[5] += self.secs - int_secs
-        return ephem.Date(tuple(timetuple))
+        # Ephem dates are in Dublin Julian Days, and UTC seconds map linearly onto them
+        return ephem.Date(self.secs / 86400.0 + _UNIX_EPOCH_DJD)
 
     def to_mjd(self):
         """Convert timestamp to Modified Julian Day (MJD)."""
         # Ephem dates are in Dublin Julian Days
         djd = self.to_ephem_date()
         return djd + 2415020 - 2400000.5
+
+
+def _ephem_date(timestamp):
+    """Convert single timestamp to ephem date, bypassing :class:`Timestamp` for plain numbers."""
+    if isinstance(timestamp, (float, int, np.number)) and not isinstance(timestamp, ephem.Date):
+        return float(timestamp) / 86400.0 + _UNIX_EPOCH_DJD
+    return Timestamp(timestamp).to_ephem_date()
+
+
+def _ephem_dates(timestamps):
+    """Convert sequence of timestamps to array of ephem dates in one go."""
+    secs = np.asarray(timestamps)
+    if not isinstance(timestamps, np.ndarray) or secs.dtype.kind not in 'fiu':
+        # Only plain numbers represent UTC seconds (sequences of ephem dates also look numeric to NumPy)
+        objects = np.asarray(timestamps, dtype=object)
+        if secs.dtype.kind not in 'fiu' or any(isinstance(t, ephem.Date) for t in objects.flat):
+            # Fall back to parsing each timestamp (e.g. Timestamp objects, ephem dates or date strings)
+            secs = np.array([Timestamp(t).secs for t in objects.flat]).reshape(objects.shape)
+    return secs.astype(np.float64) / 86400.0 + _UNIX_EPOCH_DJD